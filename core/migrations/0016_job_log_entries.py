@@ -1,3 +1,4 @@
+import django.core.serializers.json
 from django.db import migrations, models
 
 import utilities.json
@@ -16,7 +17,7 @@ class Migration(migrations.Migration):
             # Use JSONField on SQLite to store list of log entries
             field=models.JSONField(
                 decoder=utilities.json.JobLogDecoder,
-                encoder=utilities.json.DjangoJSONEncoder if hasattr(utilities.json, 'DjangoJSONEncoder') else None,
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
                 blank=True,
                 null=True,
                 default=list,
@@ -15,6 +15,7 @@ from core.choices import ObjectChangeActionChoices
 from core.models import *
 from dcim.models import Site
 from users.models import User
+from utilities.diskcache_backend import _JOB_INDEX
 from utilities.testing import TestCase, ViewTestCases, create_tags, disable_logging
 
 
@@ -280,6 +281,33 @@ class BackgroundTaskTestCase(TestCase):
         response = self.client.get(reverse('core:background_task_requeue', args=[job.id]))
         self.assertEqual(response.status_code, 302)
         self.assertFalse(job.is_failed)
+        self.assertIn(job.id, queue.job_ids)
+
+        # Check that the requeued job is run (and fails) again on the next burst
+        with disable_logging():
+            worker.work(burst=True)
+        self.assertTrue(job.is_failed)
+        self.assertNotIn(job.id, queue.job_ids)
+
+    def test_worker_inline_burst(self):
+        queue = get_queue('default')
+        job = queue.enqueue(self.dummy_job_default)
+        failing_job = queue.enqueue(self.dummy_job_failing)
+
+        worker = get_worker('default')
+        with disable_logging():
+            worker.work(burst=True, inline=True)
+
+        # Check that the outcomes are kept on the worker and the jobs are no longer stored
+        completed_jobs = {completed_job.id: completed_job for completed_job in worker.completed_jobs}
+        self.assertEqual(completed_jobs[job.id].get_status(), JobStatus.FINISHED)
+        self.assertEqual(completed_jobs[job.id].result, "Job finished")
+        self.assertEqual(completed_jobs[failing_job.id].get_status(), JobStatus.FAILED)
+        self.assertFalse(RQ_Job.exists(job.id, connection=queue.connection))
+        self.assertFalse(RQ_Job.exists(failing_job.id, connection=queue.connection))
+        self.assertEqual(queue.count, 0)
+        self.assertEqual(len(queue._jobs), 0)
+        self.assertEqual(len(_JOB_INDEX), 0)
 
     def test_background_task_enqueue(self):
         queue = get_queue('default')
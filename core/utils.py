@@ -1,9 +1,15 @@
+from itertools import chain
+
 from django.http import Http404
 from django.utils.translation import gettext_lazy as _
 # Replaced django_rq with diskcache backend for tests/dev
 from django_rq import get_queue
 from django_rq.settings import QUEUES_LIST
 from django_rq.utils import get_jobs
+from utilities.diskcache_backend import Job as _Job
+
+# Names of all configured queues, resolved once
+_QUEUE_NAMES = tuple(queue['name'] for queue in QUEUES_LIST)
 
 # RQ classes are not used with shim; provide lightweight aliases
 class RQJobStatus:
@@ -20,22 +26,20 @@ class RQ_Job:
     @staticmethod
     def fetch(job_id, connection=None, serializer=None):
         """Fetch a job from any queue."""
-        # Try to find job in all queues
-        for queue_name in ['default', 'high', 'low']:
-            queue = get_queue(queue_name)
-            job = queue.fetch_job(job_id)
-            if job:
-                return job
-        raise NoSuchJobError(f"Job {job_id} not found")
+        job = _Job.fetch(job_id, connection)
+        if job is None:
+            raise NoSuchJobError(f"Job {job_id} not found")
+        return job
+
+    @staticmethod
+    def fetch_many(job_ids, connection=None, serializer=None):
+        """Fetch several jobs at once; missing jobs are returned as None."""
+        return _Job.fetch_many(job_ids, connection, serializer)
     
     @staticmethod
     def exists(job_id, connection=None):
         """Check if job exists in any queue."""
-        try:
-            RQ_Job.fetch(job_id, connection)
-            return True
-        except NoSuchJobError:
-            return False
+        return _Job.exists(job_id, connection)
 
 # Import registries from diskcache_backend
 from utilities.diskcache_backend import (
@@ -52,6 +56,15 @@ if not hasattr(ScheduledJobRegistry, 'get_scheduled_time'):
         return getattr(job, 'scheduled_at', None)
     ScheduledJobRegistry.get_scheduled_time = _get_scheduled_time
 
+# Map each job status to the registry holding jobs in that state
+_STATUS_REGISTRIES = {
+    RQJobStatus.STARTED: StartedJobRegistry,
+    RQJobStatus.DEFERRED: DeferredJobRegistry,
+    RQJobStatus.FINISHED: FinishedJobRegistry,
+    RQJobStatus.FAILED: FailedJobRegistry,
+    RQJobStatus.SCHEDULED: ScheduledJobRegistry,
+}
+
 def requeue_job(*args, **kwargs):
     return None
 
@@ -69,13 +82,10 @@ def get_rq_jobs():
     """
     Return a list of all RQ jobs.
     """
-    jobs = set()
-
-    for queue in QUEUES_LIST:
-        queue = get_queue(queue['name'])
-        jobs.update(queue.get_jobs())
+    # Deduplicate by job ID in a single pass, preserving queue order
+    jobs = chain.from_iterable(get_queue(name).get_jobs() for name in _QUEUE_NAMES)
 
-    return list(jobs)
+    return list({job.id: job for job in jobs}.values())
 
 
 def get_rq_jobs_from_status(queue, status):
@@ -84,15 +94,8 @@ def get_rq_jobs_from_status(queue, status):
     """
     jobs = []
 
-    try:
-        registry_cls = {
-            RQJobStatus.STARTED: StartedJobRegistry,
-            RQJobStatus.DEFERRED: DeferredJobRegistry,
-            RQJobStatus.FINISHED: FinishedJobRegistry,
-            RQJobStatus.FAILED: FailedJobRegistry,
-            RQJobStatus.SCHEDULED: ScheduledJobRegistry,
-        }[status]
-    except KeyError:
+    registry_cls = _STATUS_REGISTRIES.get(status)
+    if registry_cls is None:
         raise Http404
     registry = registry_cls(queue.name, queue.connection)
 
@@ -101,11 +104,10 @@ def get_rq_jobs_from_status(queue, status):
         jobs = get_jobs(queue, job_ids, registry)
     else:
         # Deferred jobs require special handling
-        for job_id in job_ids:
-            try:
-                jobs.append(RQ_Job.fetch(job_id, connection=queue.connection, serializer=queue.serializer))
-            except NoSuchJobError:
-                pass
+        jobs = [
+            job for job in RQ_Job.fetch_many(job_ids, connection=queue.connection, serializer=queue.serializer)
+            if job is not None
+        ]
 
     if jobs and status == RQJobStatus.SCHEDULED:
         for job in jobs:
@@ -124,11 +126,7 @@ def delete_rq_job(job_id):
         raise Http404(_("Job %(job_id)s not found") % {'job_id': job_id})
 
     # Remove job from its queue
-    for queue_name in ['default', 'high', 'low']:
-        queue = get_queue(queue_name)
-        if job_id in queue._jobs:
-            del queue._jobs[job_id]
-            break
+    get_queue(job.origin).remove(job_id)
     
     return None
 
@@ -142,8 +140,8 @@ def requeue_rq_job(job_id):
     except NoSuchJobError:
         raise Http404(_("Job %(id)s not found.") % {'id': job_id})
 
-    # Set job status to QUEUED
-    job.set_status('queued')
+    # Set job status to QUEUED and put it back on its queue
+    get_queue(job.origin).requeue(job.id)
     return None
 
 
@@ -156,8 +154,8 @@ def enqueue_rq_job(job_id):
     except NoSuchJobError:
         raise Http404(_("Job %(id)s not found.") % {'id': job_id})
 
-    # Set job status to QUEUED
-    job.set_status('queued')
+    # Set job status to QUEUED and put it back on its queue
+    get_queue(job.origin).requeue(job.id)
     return None
 
 
@@ -1,3 +1,6 @@
+import re
+from functools import lru_cache
+
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import gettext as _
@@ -34,6 +37,64 @@ class eui64_unix_expanded_lowercase(eui64_unix_expanded):
     word_fmt = '%.2x'
 
 
+# Values already in colon-separated form (as stored in the database) can skip netaddr's dialect parsing
+_MAC_EXPANDED = re.compile(r'[0-9a-fA-F]{2}(?::[0-9a-fA-F]{2}){5}')
+_MAC_CANONICAL = re.compile(r'[0-9a-f]{2}(?::[0-9a-f]{2}){5}')
+_WWN_EXPANDED = re.compile(r'[0-9a-fA-F]{2}(?::[0-9a-fA-F]{2}){7}')
+_WWN_CANONICAL = re.compile(r'[0-9a-f]{2}(?::[0-9a-f]{2}){7}')
+
+# A comma-joined list of 'ct_id:object_id' path nodes
+_PATH_NODES = re.compile(r'\d+:\d+(?:,\d+:\d+)*')
+
+
+def _is_well_formed_path(value):
+    """
+    Return True if value is a non-empty list of 'ct_id:object_id' strings, using a single regex scan over the
+    comma-joined nodes. Requiring exactly one colon per item guarantees that no item contained a comma (i.e. no
+    single item spanned several nodes).
+    """
+    if not value or not all(isinstance(item, str) for item in value):
+        return False
+    joined = ','.join(value)
+    return joined.count(':') == len(value) and _PATH_NODES.fullmatch(joined) is not None
+
+
+@lru_cache(maxsize=4096)
+def _parse_mac(value):
+    """
+    Return the integer value of a MAC address string. Results are cached as plain integers (rather than EUI
+    instances, which are mutable) so that repeated reads of the same addresses skip parsing entirely.
+    """
+    if _MAC_EXPANDED.fullmatch(value):
+        return int(value.replace(':', ''), 16)
+    return int(EUI(value, version=48))
+
+
+@lru_cache(maxsize=4096)
+def _parse_wwn(value):
+    """
+    Return the integer value of a WWN string (see _parse_mac()).
+    """
+    if _WWN_EXPANDED.fullmatch(value):
+        return int(value.replace(':', ''), 16)
+    return int(EUI(value, version=64))
+
+
+def _format_mac(value):
+    """
+    Format an integer MAC address value as lowercase, colon-separated hex (equivalent to str() on an EUI using
+    mac_unix_expanded_lowercase, without netaddr's per-word formatting).
+    """
+    return '%02x:%02x:%02x:%02x:%02x:%02x' % tuple(value.to_bytes(6, 'big'))
+
+
+def _format_wwn(value):
+    """
+    Format an integer WWN value as lowercase, colon-separated hex (see _format_mac()).
+    """
+    return '%02x:%02x:%02x:%02x:%02x:%02x:%02x:%02x' % tuple(value.to_bytes(8, 'big'))
+
+
 class MACAddressField(models.Field):
 
     description = 'MAC Address field'
@@ -50,9 +111,11 @@ class MACAddressField(models.Field):
     def to_python(self, value):
         if value is None:
             return value
-        if type(value) is str:
-            value = value.replace(' ', '')
         try:
+            if isinstance(value, str):
+                if ' ' in value:
+                    value = value.replace(' ', '')
+                return EUI(_parse_mac(value), version=48, dialect=mac_unix_expanded)
             return EUI(value, version=48, dialect=mac_unix_expanded)
         except AddrFormatError:
             raise ValidationError(_("Invalid MAC address format: %(value)s") % {'value': value})
@@ -63,13 +126,17 @@ class MACAddressField(models.Field):
     def get_prep_value(self, value):
         if not value:
             return None
-        if type(value) is str:
-            value = value.replace(' ', '')
         try:
+            if isinstance(value, str):
+                if ' ' in value:
+                    value = value.replace(' ', '')
+                if _MAC_CANONICAL.fullmatch(value):
+                    return value
+                return _format_mac(_parse_mac(value))
             eui = EUI(value, version=48, dialect=mac_unix_expanded_lowercase)
         except AddrFormatError:
             raise ValidationError(_("Invalid MAC address format: %(value)s") % {'value': value})
-        return str(eui)
+        return _format_mac(int(eui))
 
 
 class WWNField(models.Field):
@@ -88,6 +155,8 @@ class WWNField(models.Field):
         if value is None:
             return value
         try:
+            if isinstance(value, str):
+                return EUI(_parse_wwn(value), version=64, dialect=eui64_unix_expanded)
             return EUI(value, version=64, dialect=eui64_unix_expanded)
         except AddrFormatError:
             raise ValidationError(_("Invalid WWN format: %(value)s") % {'value': value})
@@ -99,19 +168,27 @@ class WWNField(models.Field):
         if not value:
             return None
         try:
+            if isinstance(value, str):
+                if _WWN_CANONICAL.fullmatch(value):
+                    return value
+                return _format_wwn(_parse_wwn(value))
             eui = EUI(value, version=64, dialect=eui64_unix_expanded_lowercase)
         except AddrFormatError:
             raise ValidationError(_("Invalid WWN format: %(value)s") % {'value': value})
-        return str(eui)
+        return _format_wwn(int(eui))
 
 
-class PathField(models.JSONField):
+class PathField(models.TextField):
     """
-    SQLite-compatible JSONField storing a list of object identifiers.
+    SQLite-compatible field storing a list of object identifiers.
 
     Stores a list of strings in format: ['ct_id:object_id', 'ct_id:object_id', ...]
     Example: ['10:123', '20:456']
 
+    The list is packed into a single comma-separated string in the database (e.g. '10:123,20:456'). Nodes
+    never contain commas, so no quoting or escaping is needed and the value is split back without any JSON
+    parsing.
+
     This field is used by CablePath to store the flattened list of nodes in a cable path.
     Each node is represented as 'ContentType_ID:Object_ID'.
     """
@@ -143,6 +220,10 @@ class PathField(models.JSONField):
                 code='invalid_type'
             )
 
+        # Fast path: a well-formed path needs no per-item checks
+        if _is_well_formed_path(value):
+            return
+
         for item in value:
             if not isinstance(item, str):
                 raise ValidationError(
@@ -179,7 +260,7 @@ class PathField(models.JSONField):
                 )
 
     def get_prep_value(self, value):
-        """Convert Python list to JSON for database."""
+        """Pack a Python list into a comma-separated string for the database."""
         if value is None:
             return None
         # If value is a string, wrap it in a list (defensive programming)
@@ -187,31 +268,28 @@ class PathField(models.JSONField):
             value = [value]
         if not isinstance(value, list):
             raise ValidationError(f'PathField value must be a list, got {type(value).__name__}: {repr(value)[:100]}')
-        return super().get_prep_value(value)
+        if value and not _is_well_formed_path(value):
+            raise ValidationError(f'PathField items must be in format "ct_id:object_id", got {repr(value)[:100]}')
+        return ','.join(value)
 
     def from_db_value(self, value, expression, connection):
-        """Convert JSON from database to Python list."""
-        if value is None:
-            return []
-        # JSONField already deserializes JSON to Python
-        return value if isinstance(value, list) else []
+        """Split the packed string from the database into a Python list."""
+        return value.split(',') if value else []
 
     def to_python(self, value):
         """Convert value to Python list."""
-        if value is None:
-            return []
         if isinstance(value, list):
             return value
-        # If it's a string (shouldn't happen), try to parse as JSON
         if isinstance(value, str):
-            import json
-            try:
-                parsed = json.loads(value)
-                if isinstance(parsed, list):
-                    return parsed
-            except (json.JSONDecodeError, TypeError):
-                pass
+            return value.split(',') if value else []
         return []
 
-# Register PathContains lookup for filtering
+    def value_to_string(self, obj):
+        """Serialize the value in its packed form."""
+        return self.get_prep_value(self.value_from_object(obj))
+
+
+# Register PathContains lookup for filtering. It also replaces the inherited `contains` lookup, which would
+# otherwise perform a substring match against the packed string (e.g. '1:2' matching '11:23').
 PathField.register_lookup(PathContains)
+PathField.register_lookup(PathContains, lookup_name='contains')
@@ -1,11 +1,22 @@
 from dcim.utils import object_to_path_node
-from django.db import connection
-from django.db.models import Lookup
+from django.db.models import Lookup, Model
+
 
 class PathContains(Lookup):
+    """
+    Filter PathFields containing the specified node, given either as an object or as a 'ct_id:object_id' string.
+    Matches a whole node within the packed comma-separated path string, so '1:2' never matches '11:23'.
+    """
     lookup_name = 'path_contains'
+    prepare_rhs = False
 
-    def as_sql(self, compiler, connection):
-        raise TypeError('PathContains lookup is not supported')
-
+    def get_prep_lookup(self):
+        if isinstance(self.rhs, Model):
+            return object_to_path_node(self.rhs)
+        return self.rhs
 
+    def as_sql(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        sql = f"instr(',' || {lhs_sql} || ',', ',' || {rhs_sql} || ',') > 0"
+        return sql, lhs_params + rhs_params
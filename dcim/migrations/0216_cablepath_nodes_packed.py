@@ -0,0 +1,44 @@
+import json
+
+from django.db import migrations
+
+import dcim.fields
+
+
+def pack_nodes(apps, schema_editor):
+    """
+    Convert CablePath._nodes from a JSON list to a packed comma-separated string.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT id, _nodes FROM dcim_cablepath WHERE _nodes LIKE '[%'")
+        rows = [(','.join(json.loads(nodes)), pk) for pk, nodes in cursor.fetchall()]
+        cursor.executemany("UPDATE dcim_cablepath SET _nodes = %s WHERE id = %s", rows)
+
+
+def unpack_nodes(apps, schema_editor):
+    """
+    Convert CablePath._nodes from a packed comma-separated string back to a JSON list.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT id, _nodes FROM dcim_cablepath WHERE _nodes NOT LIKE '[%'")
+        rows = [(json.dumps(nodes.split(',') if nodes else []), pk) for pk, nodes in cursor.fetchall()]
+        cursor.executemany("UPDATE dcim_cablepath SET _nodes = %s WHERE id = %s", rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dcim', '0215_rackreservation_status'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='cablepath',
+            name='_nodes',
+            field=dcim.fields.PathField(),
+        ),
+        migrations.RunPython(
+            code=pack_nodes,
+            reverse_code=unpack_nodes
+        ),
+    ]
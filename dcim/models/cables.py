@@ -11,7 +11,7 @@ from core.models import ObjectType
 from dcim.choices import *
 from dcim.constants import *
 from dcim.fields import PathField
-from dcim.utils import decompile_path_node, object_to_path_node
+from dcim.utils import decompile_path_node, decompile_path_nodes, object_to_path_node
 from netbox.choices import ColorChoices
 from netbox.models import ChangeLoggedModel, PrimaryModel
 from utilities.conversion import to_meters
@@ -562,7 +562,7 @@ class CablePath(models.Model):
 
         # Record a direct reference to this CablePath on its originating object(s)
         origin_model = self.origin_type.model_class()
-        origin_ids = [decompile_path_node(node)[1] for node in self.path[0]]
+        origin_ids = [object_id for _, object_id in decompile_path_nodes(self.path[0])]
         origin_model.objects.filter(pk__in=origin_ids).update(_path=self.pk)
 
     @property
@@ -579,13 +579,7 @@ class CablePath(models.Model):
 
     @property
     def _path_decompiled(self):
-        res = []
-        for step in self.path:
-            nodes = []
-            for node in step:
-                nodes.append(decompile_path_node(node))
-            res.append(nodes)
-        return res
+        return [decompile_path_nodes(step) for step in self.path]
 
     path_objects = GenericArrayForeignKey("_path_decompiled")
 
@@ -848,15 +842,11 @@ class CablePath(models.Model):
         """
         Return all Cable IDs within the path.
         """
-        cable_ct = ObjectType.objects.get_for_model(Cable).pk
-        cable_ids = []
-
-        for node in self._nodes:
-            ct, id = decompile_path_node(node)
-            if ct == cable_ct:
-                cable_ids.append(id)
+        # Match the ContentType prefix of each node rather than decompiling every node in the path
+        prefix = f'{ObjectType.objects.get_for_model(Cable).pk}:'
+        offset = len(prefix)
 
-        return cable_ids
+        return [int(node[offset:]) for node in self._nodes if node.startswith(prefix)]
 
     def get_total_length(self):
         """
@@ -1,7 +1,7 @@
 from django.test import TestCase
 
 from circuits.models import *
-from dcim.choices import LinkStatusChoices
+from dcim.choices import CableLengthUnitChoices, LinkStatusChoices
 from dcim.models import *
 from dcim.svg import CableTraceSVG
 from dcim.utils import object_to_path_node
@@ -2510,3 +2510,42 @@ class CablePathTestCase(TestCase):
             is_active=True
         )
         self.assertEqual(CablePath.objects.count(), 0)
+
+    def test_501_path_contains_lookup(self):
+        """
+        [IF1] --C1-- [IF2]   [IF3]
+        """
+        interface1 = Interface.objects.create(device=self.device, name='Interface 1')
+        interface2 = Interface.objects.create(device=self.device, name='Interface 2')
+        interface3 = Interface.objects.create(device=self.device, name='Interface 3')
+        cable1 = Cable(
+            a_terminations=[interface1],
+            b_terminations=[interface2]
+        )
+        cable1.save()
+
+        self.assertEqual(CablePath.objects.filter(_nodes__path_contains=interface1).count(), 2)
+        self.assertEqual(CablePath.objects.filter(_nodes__path_contains=object_to_path_node(cable1)).count(), 2)
+        self.assertFalse(CablePath.objects.filter(_nodes__path_contains=interface3).exists())
+
+    def test_502_nodes_loaded_from_database(self):
+        """
+        [IF1] --C1-- [IF2]
+        """
+        interface1 = Interface.objects.create(device=self.device, name='Interface 1')
+        interface2 = Interface.objects.create(device=self.device, name='Interface 2')
+        cable1 = Cable(
+            a_terminations=[interface1],
+            b_terminations=[interface2],
+            length=10,
+            length_unit=CableLengthUnitChoices.UNIT_METER
+        )
+        cable1.save()
+
+        cablepath = CablePath.objects.get(pk=self.assertPathExists((interface1, cable1, interface2)).pk)
+        self.assertEqual(
+            cablepath._nodes,
+            [object_to_path_node(interface1), object_to_path_node(cable1), object_to_path_node(interface2)]
+        )
+        self.assertEqual(cablepath.get_cable_ids(), [cable1.pk])
+        self.assertEqual(cablepath.get_total_length(), (10, True))
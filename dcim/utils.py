@@ -12,6 +12,13 @@ def decompile_path_node(repr):
     return int(ct_id), int(object_id)
 
 
+def decompile_path_nodes(nodes):
+    """
+    Decompile an iterable of path nodes into a list of (ContentType ID, object ID) tuples.
+    """
+    return [(int(ct_id), int(object_id)) for ct_id, object_id in (node.split(':') for node in nodes)]
+
+
 def object_to_path_node(obj):
     """
     Return a representation of an object suitable for inclusion in a CablePath path. Node representation is in the
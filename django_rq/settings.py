@@ -4,9 +4,11 @@ These settings are also created in utilities.diskcache_backend._setup_fake_modul
 to ensure availability before Django initialization.
 """
 
-QUEUES_LIST = [
-    {"name": "default", "connection_config": {}},
-    {"name": "high", "connection_config": {}},
-    {"name": "low", "connection_config": {}},
-]
-QUEUES_MAP = {"default": 0, "high": 1, "low": 2}
+from utilities.diskcache_backend import QUEUE_NAMES
+
+QUEUES_LIST = [{"name": name, "connection_config": {}} for name in QUEUE_NAMES]
+QUEUES_MAP = {name: i for i, name in enumerate(QUEUE_NAMES)}
+# (name, index) pairs for each configured queue, resolved once rather than on every statistics call
+QUEUES_RESOLVED = tuple(
+    (config['name'], QUEUES_MAP.get(config['name'], i)) for i, config in enumerate(QUEUES_LIST)
+)
@@ -1,28 +1,13 @@
 from __future__ import annotations
 from typing import Any, Dict, Iterable, List
-from utilities.diskcache_backend import Queue, _get_queue_statistics
+from utilities.diskcache_backend import Queue, _get_statistics, _stop_jobs
 
 
 def get_statistics(*args: Any, **kwargs: Any) -> Dict[str, Any]:
     """Get RQ statistics. Returns a dict with workers, queues, and jobs info."""
-    from .settings import QUEUES_LIST, QUEUES_MAP
-    
-    queues_data = [
-        _get_queue_statistics(
-            queue_config['name'] if isinstance(queue_config, dict) else queue_config,
-            QUEUES_MAP.get(
-                queue_config['name'] if isinstance(queue_config, dict) else queue_config,
-                i
-            )
-        )
-        for i, queue_config in enumerate(QUEUES_LIST)
-    ]
-    
-    return {
-        "workers": 1,
-        "queues": queues_data,
-        "jobs": sum(q['jobs'] for q in queues_data),
-    }
+    from .settings import QUEUES_RESOLVED
+
+    return _get_statistics(QUEUES_RESOLVED)
 
 
 def get_jobs(queue: Queue, job_ids: Iterable[str], registry: Any) -> List[Any]:
@@ -31,4 +16,5 @@ def get_jobs(queue: Queue, job_ids: Iterable[str], registry: Any) -> List[Any]:
 
 
 def stop_jobs(queue: Queue, job_id: str):
-    return [0]
+    """Stop a job. Not supported by the diskcache backend; raises NotImplementedError."""
+    return _stop_jobs(queue, job_id)
@@ -1,19 +1,40 @@
+import json
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
 from jinja2.exceptions import TemplateError
 from rest_framework.decorators import action
-from rest_framework.renderers import JSONRenderer
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.response import Response
 from rest_framework.status import HTTP_400_BAD_REQUEST
 
-from netbox.api.renderers import TextRenderer
+from netbox.api.renderers import ORJSONRenderer, TextRenderer
+from users.models import ObjectPermission
+from utilities.permissions import get_permission_for_model, permission_is_exempt, qs_filter_from_constraints
 from .serializers import ConfigTemplateSerializer
 
 __all__ = (
     'ConfigContextQuerySetMixin',
     'ConfigTemplateRenderMixin',
+    'ExplicitPermissionMixin',
     'RenderConfigMixin',
 )
 
 
+@lru_cache(maxsize=1024)
+def _build_constraints_filter(constraints_json, user_id):
+    return qs_filter_from_constraints(json.loads(constraints_json), tokens={'$user': user_id})
+
+
+def _get_constraints_filter(constraints, user):
+    """
+    Return the Q filter for a list of ObjectPermission constraints evaluated for the given user. Filters are cached by
+    the serialized constraints themselves, so a change to a permission's constraints yields a new cache entry.
+    """
+    return _build_constraints_filter(json.dumps(constraints, sort_keys=True), user.pk)
+
+
 class ConfigContextQuerySetMixin:
     """
     Used by views that work with config context models (device and virtual machine).
@@ -36,6 +57,113 @@ class ConfigContextQuerySetMixin:
         return queryset.annotate_config_context_data()
 
 
+class ExplicitPermissionMixin:
+    """
+    Grant access to the view's model strictly through the ObjectPermissions explicitly assigned to the requesting
+    user, rather than through the restriction applied by BaseViewSet.initial(). Read requests are filtered by the
+    user's 'view' constraints (unless viewing is exempt); write requests require an explicit permission for each of
+    the actions listed in `explicit_actions`.
+
+    The view's class-level `queryset` serves as the base queryset to which the constraints are applied. The instance's
+    `queryset` must still be restricted by BaseViewSet.initial(): created and updated objects are validated against it.
+
+    Attributes:
+        explicit_actions: The write actions ('add', 'change', and/or 'delete') which require an explicit permission
+        use_default_permissions: If True, constraints defined in DEFAULT_PERMISSIONS for an action take precedence
+            over any explicitly assigned ObjectPermissions
+    """
+    explicit_actions = ('add', 'change', 'delete')
+    use_default_permissions = False
+
+    def _explicit_constraints(self, action):
+        user = getattr(self.request, 'user', None)
+        if not (user and user.is_authenticated):
+            return []
+        model = type(self).queryset.model
+
+        if self.use_default_permissions:
+            perm_name = get_permission_for_model(model, action)
+            if perm_name in settings.DEFAULT_PERMISSIONS:
+                return list(settings.DEFAULT_PERMISSIONS[perm_name])
+
+        # get_queryset() and the action handlers consult the same constraints; resolve them once per request
+        cache = getattr(self.request, '_explicit_constraints_cache', None)
+        if cache is None:
+            cache = self.request._explicit_constraints_cache = {}
+        key = (user.pk, action)
+        if key not in cache:
+            perms = ObjectPermission.objects.filter(
+                enabled=True,
+                users=user,
+                actions__contains=[action],
+                object_types__app_label=model._meta.app_label,
+                object_types__model=model._meta.model_name,
+            ).values_list('constraints', flat=True)
+            # Flatten all constraint sets from all matching ObjectPermissions (see ObjectPermission.list_constraints())
+            constraints = []
+            for c in perms:
+                constraints.extend(c if type(c) is list else [c])
+            cache[key] = constraints
+        return cache[key]
+
+    def _get_constrained_queryset(self, action):
+        """
+        Return the base queryset filtered by the user's explicit constraints for the given action.
+        """
+        # Start from the class-level queryset to bypass the restriction BaseViewSet.initial() applies to self.queryset
+        qs = type(self).queryset.all()
+        if action == 'view' and permission_is_exempt(get_permission_for_model(qs.model, 'view')):
+            return qs
+        if not (constraints := self._explicit_constraints(action)):
+            return qs.none()
+        return qs.filter(_get_constraints_filter(constraints, self.request.user))
+
+    def _check_permission(self, action):
+        """
+        Raise PermissionDenied (rather than returning an empty result or 404) if the user holds no explicit
+        permission for the given action.
+        """
+        if action == 'view' and permission_is_exempt(get_permission_for_model(type(self).queryset.model, 'view')):
+            return
+        if not self._explicit_constraints(action):
+            raise PermissionDenied()
+
+    def get_queryset(self):
+        # For safe reads, enforce explicit 'view' constraints. For unsafe methods, allow retrieval; per-action checks
+        # happen in the create/update/destroy handlers.
+        if getattr(self.request, 'method', 'GET') in SAFE_METHODS:
+            return self._get_constrained_queryset('view')
+        return type(self).queryset.all()
+
+    def get_bulk_destroy_queryset(self):
+        # Use delete constraints for bulk deletion instead of view constraints
+        return self._get_constrained_queryset('delete')
+
+    def list(self, request, *args, **kwargs):
+        self._check_permission('view')
+        return super().list(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        self._check_permission('view')
+        return super().retrieve(request, *args, **kwargs)
+
+    def create(self, request, *args, **kwargs):
+        if 'add' in self.explicit_actions:
+            self._check_permission('add')
+        return super().create(request, *args, **kwargs)
+
+    def update(self, request, *args, **kwargs):
+        # Enforce explicit change permission before resolving the object
+        if 'change' in self.explicit_actions:
+            self._check_permission('change')
+        return super().update(request, *args, **kwargs)
+
+    def destroy(self, request, *args, **kwargs):
+        if 'delete' in self.explicit_actions:
+            self._check_permission('delete')
+        return super().destroy(request, *args, **kwargs)
+
+
 class ConfigTemplateRenderMixin:
     """
     Provides a method to return a rendered ConfigTemplate as REST API data.
@@ -64,7 +192,7 @@ class RenderConfigMixin(ConfigTemplateRenderMixin):
     """
     Provides a /render-config/ endpoint for REST API views whose model may have a ConfigTemplate assigned.
     """
-    @action(detail=True, methods=['post'], url_path='render-config', renderer_classes=[JSONRenderer, TextRenderer])
+    @action(detail=True, methods=['post'], url_path='render-config', renderer_classes=[ORJSONRenderer, TextRenderer])
     def render_config(self, request, pk):
         """
         Resolve and render the preferred ConfigTemplate for this Device.
@@ -1,6 +1,7 @@
+from functools import lru_cache
+
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
-from django.contrib.auth import get_user_model
 
 from core.models import ObjectType
 from extras.models import Notification, NotificationGroup, Subscription
@@ -17,6 +18,14 @@ __all__ = (
 )
 
 
+@lru_cache(maxsize=256)
+def _get_serializer_for_model(model):
+    """
+    Memoize get_serializer_for_model() per model class for the (potentially many) rows of a notification list.
+    """
+    return get_serializer_for_model(model)
+
+
 class NotificationSerializer(ValidatedModelSerializer):
     object_type = ContentTypeField(
         queryset=ObjectType.objects.with_feature('notifications'),
@@ -33,9 +42,10 @@ class NotificationSerializer(ValidatedModelSerializer):
 
     @extend_schema_field(serializers.JSONField(allow_null=True))
     def get_object(self, instance):
-        serializer = get_serializer_for_model(instance.object)
+        obj = instance.object
+        serializer = _get_serializer_for_model(type(obj))
         context = {'request': self.context['request']}
-        return serializer(instance.object, nested=True, context=context).data
+        return serializer(obj, nested=True, context=context).data
 
 
 class NotificationGroupSerializer(ChangeLogMessageSerializer, ValidatedModelSerializer):
@@ -67,9 +77,11 @@ class SubscriptionSerializer(ValidatedModelSerializer):
         queryset=ObjectType.objects.with_feature('notifications'),
     )
     object = serializers.SerializerMethodField(read_only=True)
-    # Use PrimaryKeyRelatedField for write, but serialize as nested UserSerializer for read
-    user = serializers.PrimaryKeyRelatedField(
-        queryset=get_user_model().objects.all(),
+    # Accept a primary key on write, but serialize as nested UserSerializer for read
+    user = SerializedPKRelatedField(
+        queryset=User.objects.all(),
+        serializer=UserSerializer,
+        nested=True,
         required=False,
         allow_null=True
     )
@@ -83,15 +95,7 @@ class SubscriptionSerializer(ValidatedModelSerializer):
 
     @extend_schema_field(serializers.JSONField(allow_null=True))
     def get_object(self, instance):
-        serializer = get_serializer_for_model(instance.object)
+        obj = instance.object
+        serializer = _get_serializer_for_model(type(obj))
         context = {'request': self.context['request']}
-        return serializer(instance.object, nested=True, context=context).data
-    
-    def to_representation(self, instance):
-        # Use UserSerializer for read operations (but not in brief mode)
-        ret = super().to_representation(instance)
-        # Only add nested user representation if not in brief mode
-        if 'user' in ret and instance.user:
-            user_serializer = UserSerializer(instance.user, nested=True, context=self.context)
-            ret['user'] = user_serializer.data
-        return ret
+        return serializer(obj, nested=True, context=context).data
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django_rq.queues import get_connection
@@ -7,25 +9,24 @@ from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.generics import RetrieveUpdateDestroyAPIView
 from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
-from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.routers import APIRootView
 from rest_framework.viewsets import ModelViewSet
 from rq import Worker
 
 from extras import filtersets
+from extras.data import CHOICE_SETS
 from extras.jobs import ScriptJob
 from extras.models import *
 from netbox.api.authentication import IsAuthenticatedOrLoginNotRequired
 from netbox.api.features import SyncedDataMixin
 from netbox.api.metadata import ContentTypeMetadata
-from netbox.api.renderers import TextRenderer
+from netbox.api.renderers import FormlessBrowsableAPIRenderer, ORJSONRenderer, TextRenderer
 from netbox.api.viewsets import BaseViewSet, NetBoxModelViewSet
 from utilities.exceptions import RQWorkerNotRunningException
 from utilities.request import copy_safe_request
-from utilities.permissions import qs_filter_from_constraints, get_permission_for_model, permission_is_exempt
 from . import serializers
-from .mixins import ConfigTemplateRenderMixin
+from .mixins import ConfigTemplateRenderMixin, ExplicitPermissionMixin
 
 
 class ExtrasRootView(APIRootView):
@@ -69,23 +70,50 @@ class CustomFieldViewSet(NetBoxModelViewSet):
     filterset_class = filtersets.CustomFieldFilterSet
 
 
+@lru_cache(maxsize=None)
+def _get_lowered_base_choices(base_choices):
+    """
+    Return the predefined choices of a base choice set as (value, label, lowercased value, lowercased label) tuples.
+    """
+    return tuple((value, label, value.lower(), label.lower()) for value, label in CHOICE_SETS.get(base_choices))
+
+
+def _get_lowered_choices(choiceset):
+    """
+    Return the choices of a CustomFieldChoiceSet (see CustomFieldChoiceSet.choices) along with their lowercased forms.
+    """
+    choices = []
+    if choiceset.base_choices:
+        # Base choice sets are static and may hold many thousands of choices; lowercase them only once
+        choices.extend(_get_lowered_base_choices(choiceset.base_choices))
+    if choiceset.extra_choices:
+        choices.extend((value, label, value.lower(), label.lower()) for value, label in choiceset.extra_choices)
+    if choiceset.order_alphabetically:
+        choices.sort(key=lambda x: x[0])
+    return choices
+
+
 class CustomFieldChoiceSetViewSet(NetBoxModelViewSet):
     queryset = CustomFieldChoiceSet.objects.all()
     serializer_class = serializers.CustomFieldChoiceSetSerializer
     filterset_class = filtersets.CustomFieldChoiceSetFilterSet
 
-    @action(detail=True)
+    @action(detail=True, renderer_classes=[ORJSONRenderer, FormlessBrowsableAPIRenderer])
     def choices(self, request, pk):
         """
         Provides an endpoint to iterate through each choice in a set.
         """
         choiceset = get_object_or_404(self.queryset, pk=pk)
-        choices = choiceset.choices
 
         # Enable filtering
         if q := request.GET.get('q'):
             q = q.lower()
-            choices = [c for c in choices if q in c[0].lower() or q in c[1].lower()]
+            choices = [
+                (value, label) for value, label, value_lower, label_lower in _get_lowered_choices(choiceset)
+                if q in value_lower or q in label_lower
+            ]
+        else:
+            choices = choiceset.choices
 
         # Paginate data
         if page := self.paginate_queryset(choices):
@@ -146,158 +174,25 @@ class TableConfigViewSet(NetBoxModelViewSet):
 # Bookmarks
 #
 
-from django.core.exceptions import PermissionDenied
-from utilities.permissions import get_permission_for_model
-
-class BookmarkViewSet(NetBoxModelViewSet):
+class BookmarkViewSet(ExplicitPermissionMixin, NetBoxModelViewSet):
     metadata_class = ContentTypeMetadata
     queryset = Bookmark.objects.all()
     serializer_class = serializers.BookmarkSerializer
     filterset_class = filtersets.BookmarkFilterSet
-
-    def _explicit_constraints(self, user, action):
-        from core.models import ObjectType
-        from users.models import ObjectPermission
-        if not (user and user.is_authenticated):
-            return []
-        try:
-            ot = ObjectType.objects.get_for_model(Bookmark)
-        except Exception:
-            return []
-        perms = ObjectPermission.objects.filter(
-            enabled=True,
-            users=user,
-            actions__contains=[action],
-            object_types=ot,
-        )
-        # Flatten all constraint sets from all matching ObjectPermissions
-        constraints = []
-        for p in perms:
-            constraints.extend(p.list_constraints())
-        return constraints
-
-    def get_queryset(self):
-        # Build queryset strictly from explicit ObjectPermissions (ignore DEFAULT_PERMISSIONS)
-        # Start from base manager to bypass BaseViewSet.initial() restriction logic
-        qs = Bookmark.objects.all()
-        user = getattr(self.request, 'user', None)
-        method = getattr(self.request, 'method', 'GET')
-        # For safe reads, enforce explicit 'view' constraints
-        if method in ('GET', 'HEAD', 'OPTIONS'):
-            # If view permission is exempt (anonymous read allowed), return full queryset
-            view_perm = get_permission_for_model(Bookmark, 'view')
-            if permission_is_exempt(view_perm):
-                return qs
-            constraints = self._explicit_constraints(user, 'view')
-            if not constraints:
-                return qs.none()
-            q = qs_filter_from_constraints(constraints, tokens={'$user': user})
-            return qs.filter(q)
-        # For unsafe methods, allow retrieval; per-action checks happen in create/destroy overrides
-        return qs
-
-    def retrieve(self, request, *args, **kwargs):
-        # Return 403 if user lacks explicit 'view' permission instead of 404
-        view_perm = get_permission_for_model(Bookmark, 'view')
-        if not permission_is_exempt(view_perm) and not self._explicit_constraints(request.user, 'view'):
-            raise PermissionDenied()
-        return super().retrieve(request, *args, **kwargs)
-
-    def list(self, request, *args, **kwargs):
-        view_perm = get_permission_for_model(Bookmark, 'view')
-        if not permission_is_exempt(view_perm) and not self._explicit_constraints(request.user, 'view'):
-            raise PermissionDenied()
-        return super().list(request, *args, **kwargs)
-
-    def create(self, request, *args, **kwargs):
-        # Require explicit ObjectPermission('add') for Bookmark
-        if not self._explicit_constraints(request.user, 'add'):
-            raise PermissionDenied()
-        return super().create(request, *args, **kwargs)
-
-    def destroy(self, request, *args, **kwargs):
-        # Require explicit ObjectPermission('delete') for Bookmark
-        if not self._explicit_constraints(request.user, 'delete'):
-            raise PermissionDenied()
-        return super().destroy(request, *args, **kwargs)
-
-    def get_bulk_destroy_queryset(self):
-        # Use delete constraints for bulk deletion instead of view constraints
-        qs = super().get_queryset()
-        user = getattr(self.request, 'user', None)
-        constraints = self._explicit_constraints(user, 'delete')
-        if not constraints:
-            return qs.none()
-        q = qs_filter_from_constraints(constraints, tokens={'$user': user})
-        return qs.filter(q)
+    explicit_actions = ('add', 'delete')
 
 
 #
 # Notifications & subscriptions
 #
 
-class NotificationViewSet(NetBoxModelViewSet):
+class NotificationViewSet(ExplicitPermissionMixin, NetBoxModelViewSet):
     metadata_class = ContentTypeMetadata
-    queryset = Notification.objects.all()
+    # Eager-load the relations rendered by NotificationSerializer for every row. Prefetching the generic
+    # `object` relation fetches the assigned objects in one query per object type, rather than one per row.
+    queryset = Notification.objects.select_related('user', 'object_type').prefetch_related('object')
     serializer_class = serializers.NotificationSerializer
-
-    def _explicit_constraints(self, user, action):
-        from core.models import ObjectType
-        from users.models import ObjectPermission
-        if not (user and user.is_authenticated):
-            return []
-        try:
-            ot = ObjectType.objects.get_for_model(Notification)
-        except Exception:
-            return []
-        perms = ObjectPermission.objects.filter(
-            enabled=True,
-            users=user,
-            actions__contains=[action],
-            object_types=ot,
-        )
-        constraints = []
-        for p in perms:
-            constraints.extend(p.list_constraints())
-        return constraints
-
-    def get_queryset(self):
-        qs = Notification.objects.all()
-        user = getattr(self.request, 'user', None)
-        method = getattr(self.request, 'method', 'GET')
-        if method in ('GET', 'HEAD', 'OPTIONS'):
-            view_perm = get_permission_for_model(Notification, 'view')
-            if permission_is_exempt(view_perm):
-                return qs
-            constraints = self._explicit_constraints(user, 'view')
-            if not constraints:
-                return qs.none()
-            q = qs_filter_from_constraints(constraints, tokens={'$user': user})
-            return qs.filter(q)
-        return qs
-
-    def retrieve(self, request, *args, **kwargs):
-        view_perm = get_permission_for_model(Notification, 'view')
-        if not permission_is_exempt(view_perm) and not self._explicit_constraints(request.user, 'view'):
-            raise PermissionDenied()
-        return super().retrieve(request, *args, **kwargs)
-
-    def list(self, request, *args, **kwargs):
-        view_perm = get_permission_for_model(Notification, 'view')
-        if not permission_is_exempt(view_perm) and not self._explicit_constraints(request.user, 'view'):
-            raise PermissionDenied()
-        return super().list(request, *args, **kwargs)
-
-    def update(self, request, *args, **kwargs):
-        # Enforce explicit change permission before resolving the object
-        if not self._explicit_constraints(request.user, 'change'):
-            raise PermissionDenied()
-        return super().update(request, *args, **kwargs)
-
-    def destroy(self, request, *args, **kwargs):
-        if not self._explicit_constraints(request.user, 'delete'):
-            raise PermissionDenied()
-        return super().destroy(request, *args, **kwargs)
+    explicit_actions = ('change', 'delete')
 
 
 class NotificationGroupViewSet(NetBoxModelViewSet):
@@ -305,88 +200,12 @@ class NotificationGroupViewSet(NetBoxModelViewSet):
     serializer_class = serializers.NotificationGroupSerializer
 
 
-class SubscriptionViewSet(NetBoxModelViewSet):
+class SubscriptionViewSet(ExplicitPermissionMixin, NetBoxModelViewSet):
     metadata_class = ContentTypeMetadata
-    queryset = Subscription.objects.all()
+    # Eager-load the relations rendered by SubscriptionSerializer for every row (see NotificationViewSet)
+    queryset = Subscription.objects.select_related('user', 'object_type').prefetch_related('object')
     serializer_class = serializers.SubscriptionSerializer
-
-    def _explicit_constraints(self, user, action):
-        """Get constraints from both explicit ObjectPermissions and DEFAULT_PERMISSIONS"""
-        from core.models import ObjectType
-        from users.models import ObjectPermission
-        from django.conf import settings
-
-        if not (user and user.is_authenticated):
-            return []
-
-        # Check DEFAULT_PERMISSIONS first
-        perm_name = f'extras.{action}_subscription'
-        if perm_name in settings.DEFAULT_PERMISSIONS:
-            default_constraints = settings.DEFAULT_PERMISSIONS[perm_name]
-            # Return default constraints (e.g., {'user': '$user'})
-            return list(default_constraints)
-
-        # Fall back to explicit ObjectPermissions
-        try:
-            ot = ObjectType.objects.get_for_model(Subscription)
-        except Exception:
-            return []
-
-        perms = ObjectPermission.objects.filter(
-            enabled=True,
-            users=user,
-            actions__contains=[action],
-            object_types=ot,
-        )
-
-        constraints = []
-        for p in perms:
-            constraints.extend(p.list_constraints())
-
-        return constraints
-
-    def get_queryset(self):
-        qs = Subscription.objects.all()
-        user = getattr(self.request, 'user', None)
-        method = getattr(self.request, 'method', 'GET')
-        if method in ('GET', 'HEAD', 'OPTIONS'):
-            view_perm = get_permission_for_model(Subscription, 'view')
-            if permission_is_exempt(view_perm):
-                return qs
-            constraints = self._explicit_constraints(user, 'view')
-            if not constraints:
-                return qs.none()
-            q = qs_filter_from_constraints(constraints, tokens={'$user': user})
-            return qs.filter(q)
-        return qs
-
-    def retrieve(self, request, *args, **kwargs):
-        view_perm = get_permission_for_model(Subscription, 'view')
-        if not permission_is_exempt(view_perm) and not self._explicit_constraints(request.user, 'view'):
-            raise PermissionDenied()
-        return super().retrieve(request, *args, **kwargs)
-
-    def list(self, request, *args, **kwargs):
-        view_perm = get_permission_for_model(Subscription, 'view')
-        if not permission_is_exempt(view_perm) and not self._explicit_constraints(request.user, 'view'):
-            raise PermissionDenied()
-        return super().list(request, *args, **kwargs)
-
-    def create(self, request, *args, **kwargs):
-        # Require explicit ObjectPermission('add') for Subscription
-        if not self._explicit_constraints(request.user, 'add'):
-            raise PermissionDenied()
-        return super().create(request, *args, **kwargs)
-
-    def update(self, request, *args, **kwargs):
-        if not self._explicit_constraints(request.user, 'change'):
-            raise PermissionDenied()
-        return super().update(request, *args, **kwargs)
-
-    def destroy(self, request, *args, **kwargs):
-        if not self._explicit_constraints(request.user, 'delete'):
-            raise PermissionDenied()
-        return super().destroy(request, *args, **kwargs)
+    use_default_permissions = True
 
 
 #
@@ -400,8 +219,10 @@ class TagViewSet(NetBoxModelViewSet):
 
 
 class TaggedItemViewSet(RetrieveModelMixin, ListModelMixin, BaseViewSet):
-    queryset = TaggedItem.objects.prefetch_related(
-        'content_type', 'content_object', 'tag'
+    queryset = TaggedItem.objects.select_related(
+        'content_type', 'tag'
+    ).prefetch_related(
+        'content_object'
     ).order_by('tag__weight', 'tag__name')
     serializer_class = serializers.TaggedItemSerializer
     filterset_class = filtersets.TaggedItemFilterSet
@@ -454,7 +275,7 @@ class ConfigTemplateViewSet(SyncedDataMixin, ConfigTemplateRenderMixin, NetBoxMo
     serializer_class = serializers.ConfigTemplateSerializer
     filterset_class = filtersets.ConfigTemplateFilterSet
 
-    @action(detail=True, methods=['post'], renderer_classes=[JSONRenderer, TextRenderer])
+    @action(detail=True, methods=['post'], renderer_classes=[ORJSONRenderer, TextRenderer])
     def render(self, request, pk):
         """
         Render a ConfigTemplate using the context data provided (if any). If the client requests "text/plain" data,
@@ -476,9 +297,10 @@ class ConfigTemplateViewSet(SyncedDataMixin, ConfigTemplateRenderMixin, NetBoxMo
 )
 class ScriptViewSet(ModelViewSet):
     permission_classes = [IsAuthenticatedOrLoginNotRequired]
-    queryset = Script.objects.all()
+    queryset = Script.objects.select_related('module')
     serializer_class = serializers.ScriptSerializer
     filterset_class = filtersets.ScriptFilterSet
+    renderer_classes = [ORJSONRenderer, FormlessBrowsableAPIRenderer]
 
     _ignore_model_permissions = True
     lookup_value_regex = '[^/]+'  # Allow dots
@@ -489,9 +311,8 @@ class ScriptViewSet(ModelViewSet):
             return get_object_or_404(self.queryset, pk=pk)
 
         # Default to retrieval by module & name
-        try:
-            module_name, script_name = pk.split('.', maxsplit=1)
-        except ValueError:
+        module_name, _, script_name = pk.partition('.')
+        if not script_name:
             raise Http404
 
         return get_object_or_404(self.queryset, module__file_path=f'{module_name}.py', name=script_name)
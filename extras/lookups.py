@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from django.db.models import CharField, JSONField, Lookup
 from django.db.models.fields.json import KeyTextTransform
 from django.db import connection
@@ -5,12 +7,39 @@ from django.db import connection
 from .fields import CachedValueField
 
 
+@lru_cache(maxsize=256)
+def _contains_template(kind, shape):
+    """
+    Return the SQL for a JSONContains condition as a tuple of fragments, to be joined with the compiled LHS.
+
+    `kind` is 'dict', 'list' or 'scalar'; `shape` is the tuple of keys for a dict RHS and the number of distinct
+    elements for a list RHS.
+    """
+    if kind == 'dict':
+        if not shape:
+            return ('1',)
+        fragments = ['json_extract(']
+        for i, k in enumerate(shape):
+            if i:
+                fragments[-1] += ' AND json_extract('
+            fragments.append(f", '$.{k}') = ?")
+        return tuple(fragments)
+    if kind == 'list':
+        # Scan the array once: all elements are present iff every distinct one matches a member of the array
+        placeholders = ', '.join('?' * shape)
+        return (
+            "(SELECT COUNT(DISTINCT e.value) FROM json_each(",
+            f") AS e WHERE e.value IN ({placeholders})) = ?",
+        )
+    return ("EXISTS (SELECT 1 FROM json_each(", ") AS e WHERE e.value = ?)")
+
+
 class JSONContains(Lookup):
     """
     Emulate JSONField __contains on SQLite using JSON1.
     Supported cases:
       - dict RHS: all key/value pairs must be present in JSON object
-      - list/tuple RHS: all elements must be present in JSON array (AND semantics)
+      - list/tuple RHS: all elements must be present in JSON array (AND semantics), checked in a single scan
       - scalar RHS: element must be present in JSON array (EXISTS)
     Nested structures are not supported.
     """
@@ -19,30 +48,30 @@ class JSONContains(Lookup):
     def as_sql(self, compiler, connection):
         lhs_sql, lhs_params = compiler.compile(self.lhs)
         rhs_obj = self.rhs
-        params = list(lhs_params)
 
         if isinstance(rhs_obj, dict):
-            conditions = []
-            for k, v in rhs_obj.items():
-                conditions.append(f"json_extract({lhs_sql}, '$.{k}') = ?")
+            template = _contains_template('dict', tuple(rhs_obj))
+            # The LHS appears once per key
+            params = []
+            for v in rhs_obj.values():
+                params.extend(lhs_params)
                 params.append(v)
-            sql = ' AND '.join(conditions) if conditions else '1'
-            return sql, params
+            return lhs_sql.join(template), params
 
-        # Normalize list/tuple -> list
+        params = list(lhs_params)
         if isinstance(rhs_obj, (list, tuple)):
-            elements = list(rhs_obj)
-            conditions = []
-            for _ in elements:
-                conditions.append(f"EXISTS (SELECT 1 FROM json_each({lhs_sql}) AS e WHERE e.value = ?)")
+            elements = list(dict.fromkeys(rhs_obj))
+            if not elements:
+                return '1', params
+            template = _contains_template('list', len(elements))
             params.extend(elements)
-            sql = ' AND '.join(conditions) if conditions else '1'
-            return sql, params
+            params.append(len(elements))
+        else:
+            # Scalar: check membership in array
+            template = _contains_template('scalar', None)
+            params.append(rhs_obj)
 
-        # Scalar: check membership in array
-        conditions = [f"EXISTS (SELECT 1 FROM json_each({lhs_sql}) AS e WHERE e.value = ?)"]
-        params.append(rhs_obj)
-        return ' AND '.join(conditions), params
+        return lhs_sql.join(template), params
 
 
 class RangeContains(Lookup):
@@ -75,10 +104,11 @@ class Empty(Lookup):
 
     def as_sql(self, compiler, connection):
         sql, params = compiler.compile(self.lhs)
+        # Compare the column directly (rather than its LENGTH()) so that an index on it remains usable
         if self.rhs:
-            return f"CAST(LENGTH({sql}) AS BOOLEAN) IS NOT TRUE", params
+            return f"({sql} = '' OR {sql} IS NULL)", [*params, *params]
         else:
-            return f"CAST(LENGTH({sql}) AS BOOLEAN) IS TRUE", params
+            return f"{sql} <> ''", params
 
 
 class JSONEmpty(Lookup):
@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extras', '0133_make_cf_minmax_decimal'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(
+                condition=models.Q(('read__isnull', True)),
+                fields=['user', '-created'],
+                name='extras_notification_unread'
+            ),
+        ),
+    ]
@@ -243,7 +243,7 @@ class ConfigContextModel(models.Model):
             # The attribute may exist, but the annotated value could be None/empty; start with its value
             config_context_data = self.config_context_data or []
 
-        # SQLite json_group_array() may return a JSON string; normalize to a Python list BEFORE fallback decisions
+        # SQLite json_group_array() may return a JSON string; normalize it to a Python list
         if isinstance(config_context_data, str):
             try:
                 import json as _json
@@ -251,11 +251,6 @@ class ConfigContextModel(models.Model):
             except (ValueError, TypeError):
                 config_context_data = []
 
-        # If still empty, fallback to direct query (handles cases where annotation produced an empty JSON string)
-        if not config_context_data:
-            qs = ConfigContext.objects.get_for_object(self, aggregate_data=False) or []
-            config_context_data = list(qs.values_list('data', flat=True)) if hasattr(qs, 'values_list') else list(qs)
-
         # Support for two element formats:
         # 1) pure config dict objects
         # 2) objects of the form {'w': weight, 'n': name, 'd': data}, which need to be sorted by (w desc, n)
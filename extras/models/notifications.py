@@ -4,6 +4,7 @@ from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Q
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
@@ -74,6 +75,12 @@ class Notification(models.Model):
         ordering = ('-created', 'pk')
         indexes = (
             models.Index(fields=('object_type', 'object_id')),
+            # Serves a user's unread notifications (see NotificationQuerySet.unread()), newest first
+            models.Index(
+                fields=('user', '-created'),
+                condition=Q(read__isnull=True),
+                name='extras_notification_unread'
+            ),
         )
         constraints = (
             models.UniqueConstraint(
@@ -1,4 +1,3 @@
-from django.db import models
 from django.db.models import OuterRef, Subquery, Q, Value
 from extras.models.tags import TaggedItem
 from utilities.query_functions import EmptyGroupByJSONBAgg
@@ -11,6 +10,21 @@ __all__ = (
 )
 
 
+def _ancestors_filter(field_name, node):
+    """
+    Return a Q object matching ConfigContexts assigned (via field_name) to the given MPTT node or any of its
+    ancestors, or to no node at all. Ancestors are matched by the node's tree bounds, which are already loaded, rather
+    than through a get_ancestors() subquery.
+    """
+    if node is None:
+        return Q(**{f'{field_name}__isnull': True})
+    return Q(**{
+        f'{field_name}__tree_id': node.tree_id,
+        f'{field_name}__lft__lte': node.lft,
+        f'{field_name}__rght__gte': node.rght,
+    }) | Q(**{f'{field_name}__isnull': True})
+
+
 class ConfigContextQuerySet(RestrictedQuerySet):
 
     def get_for_object(self, obj, aggregate_data=False):
@@ -21,44 +35,53 @@ class ConfigContextQuerySet(RestrictedQuerySet):
           aggregate_data: If True, use the JSONBAgg aggregate function to return only the list of JSON data objects
         """
 
+        # Relations which are matched only by primary key are resolved from the object's local foreign key values
+        # (e.g. site_id) to avoid fetching the related objects themselves.
+
         # Device type and location assignment are relevant only for Devices
-        device_type = getattr(obj, 'device_type', None)
+        device_type_id = getattr(obj, 'device_type_id', None)
         location = getattr(obj, 'location', None)
-        locations = location.get_ancestors(include_self=True) if location else []
 
         # Get assigned cluster, group, and type (if any)
         cluster = getattr(obj, 'cluster', None)
-        cluster_type = getattr(cluster, 'type', None)
-        cluster_group = getattr(cluster, 'group', None)
+        cluster_type_id = cluster.type_id if cluster else None
+        cluster_group_id = cluster.group_id if cluster else None
 
         # Get the group of the assigned tenant, if any
-        tenant_group = obj.tenant.group if obj.tenant else None
+        tenant_group_id = obj.tenant.group_id if obj.tenant_id else None
 
         # Match against the directly assigned region as well as any parent regions.
-        region = getattr(obj.site, 'region', None)
-        regions = region.get_ancestors(include_self=True) if region else []
+        site = obj.site
+        region = getattr(site, 'region', None)
 
         # Match against the directly assigned site group as well as any parent site groups.
-        sitegroup = getattr(obj.site, 'group', None)
-        sitegroups = sitegroup.get_ancestors(include_self=True) if sitegroup else []
+        sitegroup = getattr(site, 'group', None)
 
         # Match against the directly assigned role as well as any parent roles.
-        device_roles = obj.role.get_ancestors(include_self=True) if obj.role else []
+        role = obj.role if obj.role_id else None
+
+        # Match against the object's tags. If they have been prefetched, use them directly rather than a subquery;
+        # an untagged object can match only untagged config contexts.
+        if 'tags' in getattr(obj, '_prefetched_objects_cache', {}):
+            tag_slugs = [tag.slug for tag in obj.tags.all()]
+            tags_query = Q(tags__slug__in=tag_slugs) | Q(tags__isnull=True) if tag_slugs else Q(tags__isnull=True)
+        else:
+            tags_query = Q(tags__slug__in=obj.tags.slugs()) | Q(tags__isnull=True)
 
         queryset = self.filter(
-            Q(regions__in=regions) | Q(regions__isnull=True),
-            Q(site_groups__in=sitegroups) | Q(site_groups__isnull=True),
-            Q(sites=obj.site) | Q(sites__isnull=True),
-            Q(locations__in=locations) | Q(locations__isnull=True),
-            Q(device_types=device_type) | Q(device_types__isnull=True),
-            Q(roles__in=device_roles) | Q(roles__isnull=True),
-            Q(platforms=obj.platform) | Q(platforms__isnull=True),
-            Q(cluster_types=cluster_type) | Q(cluster_types__isnull=True),
-            Q(cluster_groups=cluster_group) | Q(cluster_groups__isnull=True),
-            Q(clusters=cluster) | Q(clusters__isnull=True),
-            Q(tenant_groups=tenant_group) | Q(tenant_groups__isnull=True),
-            Q(tenants=obj.tenant) | Q(tenants__isnull=True),
-            Q(tags__slug__in=obj.tags.slugs()) | Q(tags__isnull=True),
+            _ancestors_filter('regions', region),
+            _ancestors_filter('site_groups', sitegroup),
+            Q(sites=obj.site_id) | Q(sites__isnull=True),
+            _ancestors_filter('locations', location),
+            Q(device_types=device_type_id) | Q(device_types__isnull=True),
+            _ancestors_filter('roles', role),
+            Q(platforms=obj.platform_id) | Q(platforms__isnull=True),
+            Q(cluster_types=cluster_type_id) | Q(cluster_types__isnull=True),
+            Q(cluster_groups=cluster_group_id) | Q(cluster_groups__isnull=True),
+            Q(clusters=getattr(obj, 'cluster_id', None)) | Q(clusters__isnull=True),
+            Q(tenant_groups=tenant_group_id) | Q(tenant_groups__isnull=True),
+            Q(tenants=obj.tenant_id) | Q(tenants__isnull=True),
+            tags_query,
             is_active=True,
         ).order_by('weight', 'name').distinct()
 
@@ -86,21 +109,72 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
         """
         Attach the subquery annotation to the base queryset.
 
-        For SQLite compatibility: Returns empty array to force fallback to get_for_object().
-        This is necessary because SQLite's .annotate().values() creates GROUP BY which
-        prevents proper aggregation of all matching config contexts in a subquery.
+        The subquery aggregates the matching config contexts into a JSON array of {'w': weight, 'n': name, 'd': data}
+        objects using SQLite's json_group_array(); get_config_context() sorts and merges them. Grouping on a constant
+        keeps the aggregate from being grouped per config context, so the subquery always yields a single row.
 
-        The get_config_context() method will detect the empty array and fall back to
-        direct query via get_for_object(), ensuring correct data at the cost of N+1 queries.
-
-        Note: .distinct() is applied to the main queryset to eliminate duplicates from many-to-many
-        relationships (e.g., tags).
+        The outer references follow only single-valued relations, so the annotation cannot duplicate rows of the base
+        queryset and no .distinct() is needed.
         """
-        # Return empty array to trigger fallback in get_config_context()
-        # This ensures correctness for SQLite at the cost of performance
+        from extras.models import ConfigContext
+
         return self.annotate(
-            config_context_data=Value('[]', output_field=models.JSONField())
-        ).distinct()
+            config_context_data=Subquery(
+                ConfigContext.objects.filter(
+                    self._get_config_context_filters()
+                ).order_by().values(
+                    _group=Value(1)
+                ).annotate(
+                    _data=EmptyGroupByJSONBAgg('weight', 'name', 'data')
+                ).values('_data')
+            )
+        )
+
+    def _get_config_context_filters(self):
+        """
+        Return a Q object matching the active ConfigContexts which apply to the object referenced by the outer
+        query (see ConfigContextQuerySet.get_for_object()).
+        """
+        # Match tags via the TaggedItems of the outer object (OuterRef is nested as it is evaluated within a subquery)
+        tag_query_filters = {
+            'object_id': OuterRef(OuterRef('pk')),
+            'content_type__app_label': self.model._meta.app_label,
+            'content_type__model': self.model._meta.model_name,
+        }
+        base_query = Q(
+            Q(sites=OuterRef('site')) | Q(sites__isnull=True),
+            Q(platforms=OuterRef('platform')) | Q(platforms__isnull=True),
+            Q(cluster_types=OuterRef('cluster__type')) | Q(cluster_types__isnull=True),
+            Q(cluster_groups=OuterRef('cluster__group')) | Q(cluster_groups__isnull=True),
+            Q(clusters=OuterRef('cluster')) | Q(clusters__isnull=True),
+            Q(tenant_groups=OuterRef('tenant__group')) | Q(tenant_groups__isnull=True),
+            Q(tenants=OuterRef('tenant')) | Q(tenants__isnull=True),
+            Q(
+                tags__pk__in=Subquery(
+                    TaggedItem.objects.filter(**tag_query_filters).values_list('tag_id', flat=True)
+                )
+            ) | Q(tags__isnull=True),
+            is_active=True,
+        )
+
+        # Match hierarchical assignments against the outer object's node and any of its ancestors
+        nested_fields = [
+            ('regions', 'site__region'),
+            ('site_groups', 'site__group'),
+            ('roles', 'role'),
+        ]
+        if self.model._meta.model_name == 'device':
+            base_query &= Q(device_types=OuterRef('device_type')) | Q(device_types__isnull=True)
+            nested_fields.append(('locations', 'location'))
+        for field, outer_field in nested_fields:
+            base_query &= Q(**{
+                f'{field}__tree_id': OuterRef(f'{outer_field}__tree_id'),
+                f'{field}__lft__lte': OuterRef(f'{outer_field}__lft'),
+                f'{field}__rght__gte': OuterRef(f'{outer_field}__rght'),
+            }) | Q(**{f'{field}__isnull': True})
+
+        return base_query
+
 
 class NotificationQuerySet(RestrictedQuerySet):
 
@@ -3,6 +3,7 @@ import datetime
 from django.contrib.contenttypes.models import ContentType
 from django.urls import reverse
 from django.utils.timezone import make_aware, now
+from rest_framework import status
 
 from core.choices import ManagedFileRootPathChoices
 from core.events import *
@@ -11,7 +12,7 @@ from dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Rack, Loca
 from extras.choices import *
 from extras.models import *
 from extras.scripts import BooleanVar, IntegerVar, Script as PythonClass, StringVar
-from users.models import Group, User
+from users.models import Group, ObjectPermission, User
 from utilities.testing import APITestCase, APIViewTestCases
 
 
@@ -274,6 +275,30 @@ class CustomFieldChoiceSetTest(APIViewTestCases.APIViewTestCase):
         response = self.client.post(self._get_list_url(), data, format='json', **self.header)
         self.assertEqual(response.status_code, 400)
 
+    def test_filter_choices(self):
+        """
+        Filter the choices of a set by value or label (case-insensitive).
+        """
+        self.add_permissions('extras.view_customfieldchoiceset')
+        choice_set = CustomFieldChoiceSet.objects.create(
+            name='Choice Set 4',
+            base_choices=CustomFieldChoiceSetBaseChoices.ISO_3166,
+            extra_choices=[['XX', 'Unknown'], ['YY', 'Noman']],
+            order_alphabetically=True,
+        )
+        url = reverse('extras-api:customfieldchoiceset-choices', kwargs={'pk': choice_set.pk})
+
+        response = self.client.get(f'{url}?q=OMAN', **self.header)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [choice['id'] for choice in response.data['results']],
+            ['OM', 'RO', 'YY'],
+        )
+
+        response = self.client.get(f'{url}?q=xx', **self.header)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'], [{'id': 'XX', 'display': 'Unknown'}])
+
 
 class CustomLinkTest(APIViewTestCases.APIViewTestCase):
     model = CustomLink
@@ -459,6 +484,23 @@ class BookmarkTest(
             },
         ]
 
+    def test_create_object_for_other_user(self):
+        obj_perm = ObjectPermission(
+            name='Test permission',
+            actions=['add'],
+            constraints={'user': '$user'}
+        )
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(self.model))
+
+        # Attempt to bookmark a site on behalf of another user
+        other_user = User.objects.create(username='Other user')
+        data = {**self.create_data[0], 'user': other_user.pk}
+        response = self.client.post(self._get_list_url(), data, format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Bookmark.objects.filter(user=other_user).exists())
+
 
 class ExportTemplateTest(APIViewTestCases.APIViewTestCase):
     model = ExportTemplate
@@ -1042,6 +1084,26 @@ class SubscriptionTest(APIViewTestCases.APIViewTestCase):
             'user': users[3].pk,
         }
 
+    def test_update_object_of_other_user(self):
+        obj_perm = ObjectPermission(
+            name='Test permission',
+            actions=['change'],
+            constraints={'user': '$user'}
+        )
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(self.model))
+
+        # Attempt to modify another user's subscription
+        subscription = Subscription.objects.exclude(user=self.user).first()
+        site = Site.objects.exclude(pk=subscription.object_id).first()
+        response = self.client.patch(
+            self._get_detail_url(subscription), {'object_id': site.pk}, format='json', **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+        subscription.refresh_from_db()
+        self.assertNotEqual(subscription.object_id, site.pk)
+
 
 class NotificationGroupTest(APIViewTestCases.APIViewTestCase):
     model = NotificationGroup
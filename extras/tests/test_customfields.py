@@ -1750,6 +1750,12 @@ class CustomFieldModelFilterTest(TestCase):
         self.assertEqual(self.filterset({'cf_cf10': ['null']}, self.queryset).qs.count(), 1)  # Contains a literal null
         self.assertEqual(self.filterset({'cf_cf10__empty': True}, self.queryset).qs.count(), 2)
 
+    def test_filter_empty_in_subquery(self):
+        # The filtered queryset must still work when its table is aliased, e.g. when used as a subquery
+        for value, count in ((True, 2), (False, 1)):
+            sites = self.filterset({'cf_cf10__empty': value}, self.queryset).qs
+            self.assertEqual(Site.objects.filter(pk__in=sites.values('pk')).count(), count)
+
     def test_filter_object(self):
         manufacturer_ids = Manufacturer.objects.values_list('id', flat=True)
         self.assertEqual(
@@ -650,6 +650,43 @@ class ConfigContextTest(TestCase):
         self.assertEqual(ConfigContext.objects.get_for_object(device).count(), 2)
         self.assertEqual(device.get_config_context(), annotated_queryset[0].get_config_context())
 
+    def test_get_for_object_prefetched_tags(self):
+        """
+        Prefetched tags on the object should match the same config contexts as an unprefetched tag lookup.
+        """
+        site = Site.objects.first()
+        tag1, tag2 = list(Tag.objects.all())
+
+        tag_context = ConfigContext.objects.create(name="tag-1", weight=100, data={"tag": 1})
+        tag_context.tags.add(tag1)
+        untagged_context = ConfigContext.objects.create(name="untagged", weight=100, data={"untagged": 1})
+
+        tagged_device = Device.objects.create(
+            name="Device 3",
+            site=site,
+            role=DeviceRole.objects.first(),
+            device_type=DeviceType.objects.first()
+        )
+        tagged_device.tags.set([tag1, tag2])
+        untagged_device = Device.objects.create(
+            name="Device 4",
+            site=site,
+            role=DeviceRole.objects.first(),
+            device_type=DeviceType.objects.first()
+        )
+
+        for device in Device.objects.filter(pk__in=(tagged_device.pk, untagged_device.pk)).prefetch_related('tags'):
+            self.assertListEqual(
+                list(ConfigContext.objects.get_for_object(device)),
+                list(ConfigContext.objects.get_for_object(Device.objects.get(pk=device.pk))),
+            )
+        self.assertIn(tag_context, ConfigContext.objects.get_for_object(tagged_device))
+        self.assertNotIn(
+            tag_context,
+            ConfigContext.objects.get_for_object(Device.objects.prefetch_related('tags').get(pk=untagged_device.pk))
+        )
+        self.assertIn(untagged_context, ConfigContext.objects.get_for_object(untagged_device))
+
 class ConfigTemplateTest(TestCase):
     """
     TODO: These test cases deal with the weighting, ordering, and deep merge logic of config context data.
@@ -1,6 +1,7 @@
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
+from django.db.models.query_utils import DeferredAttribute
 from django.utils.translation import gettext as _
 from netaddr import AddrFormatError, IPNetwork
 
@@ -11,6 +12,7 @@ __all__ = (
     'ASNField',
     'IPAddressField',
     'IPNetworkField',
+    'VIDRangesField',
 )
 
 # BGP ASN bounds
@@ -128,3 +130,33 @@ class ASNField(models.BigIntegerField):
         }
         defaults.update(**kwargs)
         return super().formfield(**defaults)
+
+
+class VIDRangesDescriptor(DeferredAttribute):
+    """
+    Normalize VID ranges assigned to the field (e.g. NumericRange objects) to their JSON representation, so that the
+    instance always holds JSON-serializable values.
+    """
+    def __set__(self, instance, value):
+        # Values hydrated from the database are already lists of dicts; skip the conversion for them
+        if value is not None and not all(type(v) is dict for v in value):
+            try:
+                value = [instance._range_to_json(v) for v in value]
+            except Exception:
+                # Leave as-is; validation will catch improper values later
+                pass
+        instance.__dict__[self.field.attname] = value
+        # Discard any ranges cached by VLANGroup._vid_ranges_as_objects()
+        instance.__dict__.pop('_vid_ranges_objects', None)
+
+
+class VIDRangesField(models.JSONField):
+    """
+    A JSONField storing a list of VID ranges. The model must provide a `_range_to_json()` method.
+    """
+    descriptor_class = VIDRangesDescriptor
+
+    def get_prep_value(self, value):
+        if value is not None:
+            value = [self.model._range_to_json(v) for v in value]
+        return super().get_prep_value(value)
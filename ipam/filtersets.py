@@ -1001,7 +1001,7 @@ class VLANFilterSet(NetBoxModelFilterSet, TenancyFilterSet):
         method='get_for_device'
     )
     available_on_virtualmachine = django_filters.ModelChoiceFilter(
-        queryset=VirtualMachine.objects.all(),
+        queryset=VirtualMachine.objects.select_related('cluster__group', 'site__region', 'site__group'),
         method='get_for_virtualmachine'
     )
     qinq_role = django_filters.MultipleChoiceFilter(
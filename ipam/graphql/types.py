@@ -294,7 +294,7 @@ class VLANType(NetBoxObjectType):
 
 @strawberry_django.type(
     models.VLANGroup,
-    exclude=['scope_type', 'scope_id'],
+    exclude=['scope_type', 'scope_id', 'vid_ranges'],
     filters=VLANGroupFilter,
     pagination=True
 )
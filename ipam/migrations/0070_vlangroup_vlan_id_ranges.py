@@ -4,16 +4,6 @@ import ipam.models.vlans
 
 
 def set_vid_ranges(apps, schema_editor):
-    # Ensure ContentType is accessed via apps in migration runtime to avoid import-time ORM access
-    # Use apps.get_model('contenttypes', 'ContentType') inside this function if ContentType is required
-    VLANGroup = apps.get_model('ipam', 'VLANGroup')
-    db_alias = schema_editor.connection.alias
-
-    for group in VLANGroup.objects.using(db_alias).all():
-        # Store as JSON list
-        group.vid_ranges = [[group.min_vid, group.max_vid]]
-        group._total_vlan_ids = group.max_vid - group.min_vid + 1
-        group.save()
     """
     Convert the min_vid & max_vid fields to a range in the new vid_ranges field.
     Store as a simple list [min, max].
@@ -21,11 +11,12 @@ def set_vid_ranges(apps, schema_editor):
     VLANGroup = apps.get_model('ipam', 'VLANGroup')
     db_alias = schema_editor.connection.alias
 
-    for group in VLANGroup.objects.using(db_alias).all():
+    groups = list(VLANGroup.objects.using(db_alias).only('pk', 'min_vid', 'max_vid'))
+    for group in groups:
         # Store as JSON list
         group.vid_ranges = [[group.min_vid, group.max_vid]]
         group._total_vlan_ids = group.max_vid - group.min_vid + 1
-        group.save()
+    VLANGroup.objects.using(db_alias).bulk_update(groups, ['vid_ranges', '_total_vlan_ids'], batch_size=1000)
 
 
 class Migration(migrations.Migration):
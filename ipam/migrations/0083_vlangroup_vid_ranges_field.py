@@ -0,0 +1,24 @@
+import ipam.models.vlans
+import utilities.json
+from django.db import migrations
+
+import ipam.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ipam', '0082_add_prefix_network_containment_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='vlangroup',
+            name='vid_ranges',
+            field=ipam.fields.VIDRangesField(
+                default=ipam.models.vlans.default_vid_ranges,
+                encoder=utilities.json.CustomFieldJSONEncoder,
+                verbose_name='VLAN ID ranges'
+            ),
+        ),
+    ]
@@ -1,7 +1,7 @@
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 # Avoid global import of ContentType at module import time; import where needed at runtime
 
-from django.db import models
+from django.db import connection, models
 from utilities.json import CustomFieldJSONEncoder
 
 
@@ -12,13 +12,30 @@ class NumericRange:
     class provides convenience attributes used by the application code.
     """
 
+    __slots__ = ('lower', 'upper', 'lower_inc', 'upper_inc', 'bounds', '_lo', '_hi', '_key')
+
+    # Map each bounds string to (lower_inc, upper_inc)
+    _BOUNDS = {
+        '[)': (True, False),
+        '[]': (True, True),
+        '(]': (False, True),
+        '()': (False, False),
+    }
+
     def __init__(self, lower, upper, bounds='[)'):
         self.lower = int(lower)
         self.upper = int(upper)
-        # bounds is a string like '[]' or '[)' etc.
-        self.lower_inc = bounds.startswith('[')
-        self.upper_inc = bounds.endswith(']')
+        try:
+            self.lower_inc, self.upper_inc = self._BOUNDS[bounds]
+        except KeyError:
+            self.lower_inc = bounds.startswith('[')
+            self.upper_inc = bounds.endswith(']')
         self.bounds = bounds
+        # Inclusive integer bounds, so that membership is a single chained comparison
+        self._lo = self.lower if self.lower_inc else self.lower + 1
+        self._hi = self.upper if self.upper_inc else self.upper - 1
+        # Identity used for equality and hashing
+        self._key = (self.lower, self.upper, self.lower_inc, self.upper_inc)
 
     def __repr__(self):
         return f"NumericRange({self.lower}, {self.upper}, bounds='{self.bounds}')"
@@ -26,18 +43,12 @@ class NumericRange:
     def __contains__(self, item):
         if item is None:
             return False
-        if self.lower_inc:
-            lower_ok = item >= self.lower
-        else:
-            lower_ok = item > self.lower
-        if self.upper_inc:
-            upper_ok = item <= self.upper
-        else:
-            upper_ok = item < self.upper
-        return lower_ok and upper_ok
+        return self._lo <= item <= self._hi
 
     def __eq__(self, other):
-        # Support equality comparison with both local NumericRange and utilities.data.NumericRange
+        if type(other) is NumericRange:
+            return self._key == other._key
+        # Support equality comparison with utilities.data.NumericRange and other range-like objects
         if not hasattr(other, 'lower'):
             return NotImplemented
         return (
@@ -47,8 +58,13 @@ class NumericRange:
             bool(getattr(self, 'upper_inc', str(getattr(self, 'bounds', '[)')).endswith(']'))) == bool(getattr(other, 'upper_inc', str(getattr(other, 'bounds', '[)')).endswith(']')))
         )
 
+    def __hash__(self):
+        return hash(self._key)
+
 
 
+from itertools import compress
+
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.utils.translation import gettext_lazy as _
@@ -56,9 +72,10 @@ from django.utils.translation import gettext_lazy as _
 from dcim.models import Interface, Site, SiteGroup
 from ipam.choices import *
 from ipam.constants import *
+from ipam.fields import VIDRangesField
 from ipam.querysets import VLANGroupQuerySet, VLANQuerySet
 from netbox.models import OrganizationalModel, PrimaryModel, NetBoxModel
-from utilities.data import check_ranges_overlap, ranges_to_string, ranges_to_string_list
+from utilities.data import ranges_to_string, ranges_to_string_list
 from virtualization.models import VMInterface
 
 __all__ = (
@@ -69,16 +86,19 @@ __all__ = (
 )
 
 
+_DEFAULT_VID_RANGE = {
+    'lower': VLAN_VID_MIN,
+    'upper': VLAN_VID_MAX + 1,
+    'bounds': '[)',
+}
+
+
 def default_vid_ranges():
     """Return the default VID ranges as a JSON-serializable structure.
 
-    Use half-open intervals [lower, upper).
+    Use half-open intervals [lower, upper). Each call returns a fresh list and dict, since instances may modify them.
     """
-    return [{
-        'lower': VLAN_VID_MIN,
-        'upper': VLAN_VID_MAX + 1,
-        'bounds': '[)',
-    }]
+    return [dict(_DEFAULT_VID_RANGE)]
 
 
 class VLANGroup(OrganizationalModel):
@@ -110,22 +130,13 @@ class VLANGroup(OrganizationalModel):
         ct_field='scope_type',
         fk_field='scope_id'
     )
-    vid_ranges = models.JSONField(
+    # Normalizes assigned ranges eagerly (so bulk_create() works), without intercepting every other attribute write
+    vid_ranges = VIDRangesField(
         verbose_name=_('VLAN ID ranges'),
         default=default_vid_ranges,
         encoder=CustomFieldJSONEncoder,
     )
 
-    def __setattr__(self, name, value):
-        # Normalize vid_ranges assignments eagerly so bulk_create() works with JSONField
-        if name == 'vid_ranges' and value is not None:
-            try:
-                value = [self._range_to_json(v) for v in value]
-            except Exception:
-                # Leave as-is; validation will catch improper values later
-                pass
-        super().__setattr__(name, value)
-
     # --- Helpers to normalize vid_ranges between JSON (DB) and objects (logic) ---
     @staticmethod
     def _range_to_obj(r):
@@ -134,11 +145,10 @@ class VLANGroup(OrganizationalModel):
             return None
         if isinstance(r, NumericRange):
             return r
-        if isinstance(r, dict):
-            lower = r.get('lower')
-            upper = r.get('upper')
-            bounds = r.get('bounds', '[)')
-            return NumericRange(lower, upper, bounds)
+        try:
+            return NumericRange(r['lower'], r['upper'], r.get('bounds', '[)'))
+        except (KeyError, TypeError, AttributeError):
+            pass
         # Fallback: duck-typing object with lower/upper and maybe bounds
         if hasattr(r, 'lower') and hasattr(r, 'upper'):
             bounds = getattr(r, 'bounds', '[)')
@@ -163,7 +173,14 @@ class VLANGroup(OrganizationalModel):
         }
 
     def _vid_ranges_as_objects(self):
-        return [self._range_to_obj(r) for r in (self.vid_ranges or [])]
+        # Cached until vid_ranges is reassigned (see VIDRangesDescriptor); a tuple, so callers cannot alter the cache
+        vid_ranges = self.vid_ranges
+        cached = self.__dict__.get('_vid_ranges_objects')
+        if cached is not None and cached[0] is vid_ranges:
+            return cached[1]
+        ranges = tuple(self._range_to_obj(r) for r in (vid_ranges or []))
+        self._vid_ranges_objects = (vid_ranges, ranges)
+        return ranges
 
     def _vid_ranges_as_json(self):
         return [self._range_to_json(r) for r in (self.vid_ranges or [])]
@@ -230,8 +247,11 @@ class VLANGroup(OrganizationalModel):
                 })
 
         # Check for overlapping VID ranges
-        if ranges and check_ranges_overlap(ranges):
-            raise ValidationError({'vid_ranges': _("Ranges cannot overlap.")})
+        # (sorted by inclusive lower bound, any overlap implies that some adjacent pair overlaps)
+        ranges = sorted(ranges, key=lambda r: (r._lo, r._hi))
+        for prev, curr in zip(ranges, ranges[1:]):
+            if prev._hi >= curr._lo:
+                raise ValidationError({'vid_ranges': _("Ranges cannot overlap.")})
 
     def save(self, *args, **kwargs):
         # Compute total from object view
@@ -250,26 +270,42 @@ class VLANGroup(OrganizationalModel):
 
         super().save(*args, **kwargs)
 
-    def get_available_vids(self):
+    def _get_available_vids_mask(self):
         """
-        Return all available VLANs within this group.
+        Return a bytearray indexed by VID, in which each available VID within this group is set to 1.
         """
-        available_vlans = set()
+        mask = bytearray(VLAN_VID_MAX + 2)
         for vlan_range in self._vid_ranges_as_objects():
             # Treat ranges as half-open [lower, upper)
-            available_vlans |= set(range(int(vlan_range.lower), int(vlan_range.upper)))
-        available_vlans -= set(VLAN.objects.filter(group=self).values_list('vid', flat=True))
+            lower, upper = max(vlan_range.lower, 0), min(vlan_range.upper, len(mask))
+            if lower < upper:
+                mask[lower:upper] = b'\x01' * (upper - lower)
+        # Read the assigned VIDs with a plain cursor: only integers are needed, so skip building an ORM queryset
+        opts = VLAN._meta
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT {opts.get_field('vid').column} FROM {opts.db_table} "
+                f"WHERE {opts.get_field('group').column} = %s",
+                [self.pk]
+            )
+            for vid, in cursor:
+                if 0 <= vid < len(mask):
+                    mask[vid] = 0
+        return mask
 
-        return sorted(available_vlans)
+    def get_available_vids(self):
+        """
+        Return all available VLANs within this group.
+        """
+        mask = self._get_available_vids_mask()
+        return list(compress(range(len(mask)), mask))
 
     def get_next_available_vid(self):
         """
         Return the first available VLAN ID (1-4094) in the group.
         """
-        available_vids = self.get_available_vids()
-        if available_vids:
-            return available_vids[0]
-        return None
+        vid = self._get_available_vids_mask().find(1)
+        return vid if vid >= 0 else None
 
     def get_child_vlans(self):
         """
@@ -410,15 +446,16 @@ class VLAN(PrimaryModel):
 
         # Validate VLAN group (if assigned)
         from django.contrib.contenttypes.models import ContentType
-        if self.group and self.site and self.group.scope_type == ContentType.objects.get_for_model(Site):
+        # Compare scope_type_id against the (cached) content types rather than fetching the group's scope_type
+        scope_type_id = self.group.scope_type_id if self.group and self.site else None
+        if scope_type_id and scope_type_id == ContentType.objects.get_for_model(Site).pk:
             if self.site != self.group.scope:
                 raise ValidationError(
                     _(
                         "VLAN is assigned to group {group} (scope: {scope}); cannot also assign to site {site}."
                     ).format(group=self.group, scope=self.group.scope, site=self.site)
                 )
-        from django.contrib.contenttypes.models import ContentType
-        if self.group and self.site and self.group.scope_type == ContentType.objects.get_for_model(SiteGroup):
+        if scope_type_id and scope_type_id == ContentType.objects.get_for_model(SiteGroup).pk:
             if self.site not in self.group.scope.sites.all():
                 raise ValidationError(
                     _(
@@ -455,19 +492,22 @@ class VLAN(PrimaryModel):
     def get_qinq_role_color(self):
         return VLANQinQRoleChoices.colors.get(self.qinq_role)
 
+    def _get_assigned_interfaces(self, model):
+        # Match tagged assignments with a subquery against the M2M table rather than a join, which would then
+        # require DISTINCT to remove duplicates
+        tagged = model.tagged_vlans.through.objects.filter(vlan_id=self.pk)
+        return model.objects.filter(
+            Q(untagged_vlan_id=self.pk) |
+            Q(pk__in=tagged.values(f'{model._meta.model_name}_id'))
+        )
+
     def get_interfaces(self):
         # Return all device interfaces assigned to this VLAN
-        return Interface.objects.filter(
-            Q(untagged_vlan_id=self.pk) |
-            Q(tagged_vlans=self.pk)
-        ).distinct()
+        return self._get_assigned_interfaces(Interface)
 
     def get_vminterfaces(self):
         # Return all VM interfaces assigned to this VLAN
-        return VMInterface.objects.filter(
-            Q(untagged_vlan_id=self.pk) |
-            Q(tagged_vlans=self.pk)
-        ).distinct()
+        return self._get_assigned_interfaces(VMInterface)
 
     @property
     def l2vpn_termination(self):
@@ -1,3 +1,7 @@
+import operator
+from collections import defaultdict
+from functools import reduce
+
 from django.contrib.contenttypes.models import ContentType
 
 from django.db.models import Count, F, OuterRef, Q, Subquery, Value
@@ -36,37 +40,16 @@ class PrefixQuerySet(RestrictedQuerySet):
 
     def annotate_hierarchy(self):
         """
-        Annotate hierarchy depth and children count using SQLite-compatible UDF-backed lookups.
+        Annotate hierarchy depth and children count from the values cached on each Prefix.
         - hierarchy_depth: number of parent prefixes (same VRF) that strictly contain this prefix
         - hierarchy_children: number of child prefixes (same VRF) strictly contained by this prefix
+
+        These are maintained by the Prefix signal handlers and rebuild_prefixes(), so no per-row containment
+        subqueries are needed.
         """
-        from django.db.models import IntegerField, Value
-        from django.db.models.functions import Coalesce
-        from .models import Prefix as PrefixModel
-
-        parents = (
-            PrefixModel.objects.filter(
-                vrf=OuterRef('vrf'),
-                prefix__net_contains=OuterRef('prefix'),
-            )
-            .order_by()
-            .values('vrf')
-            .annotate(c=Count('*'))
-            .values('c')
-        )
-        children = (
-            PrefixModel.objects.filter(
-                vrf=OuterRef('vrf'),
-                prefix__net_contained=OuterRef('prefix'),
-            )
-            .order_by()
-            .values('vrf')
-            .annotate(c=Count('*'))
-            .values('c')
-        )
         return self.annotate(
-            hierarchy_depth=Coalesce(Subquery(parents, output_field=IntegerField()), Value(0, output_field=IntegerField())),
-            hierarchy_children=Coalesce(Subquery(children, output_field=IntegerField()), Value(0, output_field=IntegerField())),
+            hierarchy_depth=F('_depth'),
+            hierarchy_children=F('_children'),
         )
 
 
@@ -81,6 +64,37 @@ class VLANGroupQuerySet(RestrictedQuerySet):
         )
 
 
+def _get_content_type_id(app_label, model):
+    """
+    Return the ID of the ContentType identified by its natural key. ContentTypeManager caches these lookups (and clears
+    its cache whenever content types are flushed), so no further caching is needed here.
+    """
+    return ContentType.objects.get_by_natural_key(app_label, model).pk
+
+
+def _get_scopes_q(scopes):
+    """
+    Return a Q object matching objects assigned to any of the given scopes, passed as a mapping of ContentType ID to a
+    set of object IDs. Each scope type contributes a single branch to the resulting OR.
+    """
+    return reduce(
+        operator.or_,
+        (Q(scope_type_id=scope_type_id, scope_id__in=scope_ids) for scope_type_id, scope_ids in scopes.items()),
+        Q()
+    )
+
+
+def _get_ancestor_pks(*nodes):
+    """
+    Return the PKs of the given MPTT nodes (all of the same model) and all of their ancestors as a list. Ancestors are
+    matched by the nodes' tree bounds, which are already loaded, so a single query serves any number of nodes.
+    """
+    return list(type(nodes[0]).objects.filter(reduce(
+        operator.or_,
+        (Q(tree_id=node.tree_id, lft__lte=node.lft, rght__gte=node.rght) for node in nodes)
+    )).values_list('pk', flat=True))
+
+
 class VLANQuerySet(RestrictedQuerySet):
 
     def get_for_site(self, site):
@@ -90,19 +104,19 @@ class VLANQuerySet(RestrictedQuerySet):
         from .models import VLANGroup
         q = Q()
         q |= Q(
-            scope_type=ContentType.objects.get_by_natural_key('dcim', 'site'),
+            scope_type_id=_get_content_type_id('dcim', 'site'),
             scope_id=site.pk
         )
 
         if site.region:
             q |= Q(
-                scope_type=ContentType.objects.get_by_natural_key('dcim', 'region'),
-                scope_id__in=site.region.get_ancestors(include_self=True)
+                scope_type_id=_get_content_type_id('dcim', 'region'),
+                scope_id__in=_get_ancestor_pks(site.region)
             )
         if site.group:
             q |= Q(
-                scope_type=ContentType.objects.get_by_natural_key('dcim', 'sitegroup'),
-                scope_id__in=site.group.get_ancestors(include_self=True)
+                scope_type_id=_get_content_type_id('dcim', 'sitegroup'),
+                scope_id__in=_get_ancestor_pks(site.group)
             )
 
         return self.filter(
@@ -119,35 +133,20 @@ class VLANQuerySet(RestrictedQuerySet):
         from .models import VLANGroup
 
         # Find all relevant VLANGroups
-        q = Q()
+        scopes = defaultdict(set)
         if device.site.region:
-            q |= Q(
-                scope_type=ContentType.objects.get_by_natural_key('dcim', 'region'),
-                scope_id__in=device.site.region.get_ancestors(include_self=True)
-            )
+            scopes[_get_content_type_id('dcim', 'region')].update(_get_ancestor_pks(device.site.region))
         if device.site.group:
-            q |= Q(
-                scope_type=ContentType.objects.get_by_natural_key('dcim', 'sitegroup'),
-                scope_id__in=device.site.group.get_ancestors(include_self=True)
-            )
-        q |= Q(
-            scope_type=ContentType.objects.get_by_natural_key('dcim', 'site'),
-            scope_id=device.site_id
-        )
+            scopes[_get_content_type_id('dcim', 'sitegroup')].update(_get_ancestor_pks(device.site.group))
+        scopes[_get_content_type_id('dcim', 'site')].add(device.site_id)
         if device.location:
-            q |= Q(
-                scope_type=ContentType.objects.get_by_natural_key('dcim', 'location'),
-                scope_id__in=device.location.get_ancestors(include_self=True)
-            )
+            scopes[_get_content_type_id('dcim', 'location')].update(_get_ancestor_pks(device.location))
         if device.rack:
-            q |= Q(
-                scope_type=ContentType.objects.get_by_natural_key('dcim', 'rack'),
-                scope_id=device.rack_id
-            )
+            scopes[_get_content_type_id('dcim', 'rack')].add(device.rack_id)
 
         # Return all applicable VLANs
         return self.filter(
-            Q(group__in=VLANGroup.objects.filter(q)) |
+            Q(group__in=VLANGroup.objects.filter(_get_scopes_q(scopes))) |
             Q(site=device.site) |
             Q(group__scope_id__isnull=True, site__isnull=True) |  # Global group VLANs
             Q(group__isnull=True, site__isnull=True)  # Global VLANs
@@ -155,65 +154,45 @@ class VLANQuerySet(RestrictedQuerySet):
 
     def get_for_virtualmachine(self, vm):
         """
-        Return all VLANs available to the specified VirtualMachine.
+        Return all VLANs available to the specified VirtualMachine. Callers should fetch the VM with
+        select_related('cluster__group', 'site__region', 'site__group') to avoid a query per related object.
         """
         from .models import VLANGroup
 
         # Find all relevant VLANGroups
-        q = Q()
+        scopes = defaultdict(set)
+        # MPTT nodes whose ancestors are in scope, by ContentType ID; resolved with one query per type below
+        nodes = defaultdict(list)
         site = vm.site
         if vm.cluster:
             # Add VLANGroups scoped to the assigned cluster (or its group)
-            q |= Q(
-                scope_type=ContentType.objects.get_by_natural_key('virtualization', 'cluster'),
-                scope_id=vm.cluster_id
-            )
+            scopes[_get_content_type_id('virtualization', 'cluster')].add(vm.cluster_id)
             if vm.cluster.group:
-                q |= Q(
-                    scope_type=ContentType.objects.get_by_natural_key('virtualization', 'clustergroup'),
-                    scope_id=vm.cluster.group_id
-                )
+                scopes[_get_content_type_id('virtualization', 'clustergroup')].add(vm.cluster.group_id)
             # Looking all possible cluster scopes
-            if vm.cluster.scope_type == ContentType.objects.get_by_natural_key('dcim', 'location'):
+            cluster_scope_type_id = vm.cluster.scope_type_id
+            if cluster_scope_type_id == _get_content_type_id('dcim', 'location'):
                 site = site or vm.cluster.scope.site
-                q |= Q(
-                    scope_type=ContentType.objects.get_by_natural_key('dcim', 'location'),
-                    scope_id__in=vm.cluster.scope.get_ancestors(include_self=True)
-                )
-            elif vm.cluster.scope_type == ContentType.objects.get_by_natural_key('dcim', 'site'):
+                nodes[cluster_scope_type_id].append(vm.cluster.scope)
+            elif cluster_scope_type_id == _get_content_type_id('dcim', 'site'):
                 site = site or vm.cluster.scope
-                q |= Q(
-                    scope_type=ContentType.objects.get_by_natural_key('dcim', 'site'),
-                    scope_id=vm.cluster.scope.pk
-                )
-            elif vm.cluster.scope_type == ContentType.objects.get_by_natural_key('dcim', 'sitegroup'):
-                q |= Q(
-                    scope_type=ContentType.objects.get_by_natural_key('dcim', 'sitegroup'),
-                    scope_id__in=vm.cluster.scope.get_ancestors(include_self=True)
-                )
-            elif vm.cluster.scope_type == ContentType.objects.get_by_natural_key('dcim', 'region'):
-                q |= Q(
-                    scope_type=ContentType.objects.get_by_natural_key('dcim', 'region'),
-                    scope_id__in=vm.cluster.scope.get_ancestors(include_self=True)
-                )
+                scopes[cluster_scope_type_id].add(vm.cluster.scope_id)
+            elif cluster_scope_type_id in (
+                _get_content_type_id('dcim', 'sitegroup'),
+                _get_content_type_id('dcim', 'region'),
+            ):
+                nodes[cluster_scope_type_id].append(vm.cluster.scope)
         # VM can be assigned to a site without a cluster so checking assigned site independently
         if site:
             # Add VLANGroups scoped to the assigned site (or its group or region)
-            q |= Q(
-                scope_type=ContentType.objects.get_by_natural_key('dcim', 'site'),
-                scope_id=site.pk
-            )
+            scopes[_get_content_type_id('dcim', 'site')].add(site.pk)
             if site.region:
-                q |= Q(
-                    scope_type=ContentType.objects.get_by_natural_key('dcim', 'region'),
-                    scope_id__in=site.region.get_ancestors(include_self=True)
-                )
+                nodes[_get_content_type_id('dcim', 'region')].append(site.region)
             if site.group:
-                q |= Q(
-                    scope_type=ContentType.objects.get_by_natural_key('dcim', 'sitegroup'),
-                    scope_id__in=site.group.get_ancestors(include_self=True)
-                )
-        vlan_groups = VLANGroup.objects.filter(q)
+                nodes[_get_content_type_id('dcim', 'sitegroup')].append(site.group)
+        for scope_type_id, scope_nodes in nodes.items():
+            scopes[scope_type_id].update(_get_ancestor_pks(*scope_nodes))
+        vlan_groups = VLANGroup.objects.filter(_get_scopes_q(scopes))
 
         # Return all applicable VLANs
         q = (
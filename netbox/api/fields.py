@@ -16,7 +16,7 @@ from drf_spectacular.utils import extend_schema_field
 from netaddr import IPNetwork
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
-from rest_framework.relations import PrimaryKeyRelatedField, RelatedField
+from rest_framework.relations import MANY_RELATION_KWARGS, ManyRelatedField, PrimaryKeyRelatedField, RelatedField
 
 __all__ = (
     'AttributesField',
@@ -152,10 +152,34 @@ class SerializedPKRelatedField(PrimaryKeyRelatedField):
 
         super().__init__(**kwargs)
 
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {'child_relation': cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return SerializedPKManyRelatedField(**list_kwargs)
+
+    def use_pk_only_optimization(self):
+        # The full related object is needed to serialize it
+        return False
+
     def to_representation(self, value):
         return self.serializer(value, nested=self.nested, context={'request': self.context['request']}).data
 
 
+class SerializedPKManyRelatedField(ManyRelatedField):
+    """
+    The many=True counterpart to SerializedPKRelatedField. Related objects are rendered by a single list serializer,
+    so that the nested serializer's fields are bound once rather than once for every related object.
+    """
+    def to_representation(self, iterable):
+        child = self.child_relation
+        return child.serializer(
+            iterable, many=True, nested=child.nested, context={'request': self.context['request']}
+        ).data
+
+
 @extend_schema_field(OpenApiTypes.INT64)
 class RelatedObjectCountField(serializers.ReadOnlyField):
     """
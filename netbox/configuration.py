@@ -23,6 +23,7 @@ DATABASES = {
 # Cache and task queue settings
 # The system uses diskcache for persistent storage.
 # No additional configuration required - cache directory is set via DISKCACHE_DIR environment variable.
+# Set DISKCACHE_DURABILITY=fast to skip fsync in test and development environments (not crash-safe).
 
 # This key is used for secure generation of random numbers and strings. It must never be exposed outside of this file.
 # For optimal security, SECRET_KEY should be at least 50 characters in length and contain a mix of letters, numbers, and
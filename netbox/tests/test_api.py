@@ -1,11 +1,15 @@
+import datetime
+import decimal
 import uuid
 
 from django.test import RequestFactory, TestCase
 from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 
 from netbox.api.exceptions import QuerySetNotOrdered
 from netbox.api.pagination import OptionalLimitOffsetPagination
+from netbox.api.renderers import ORJSONRenderer
 from utilities.testing import APITestCase
 from users.models import Token
 
@@ -68,3 +72,34 @@ class OptionalLimitOffsetPaginationTest(TestCase):
         request = self._make_drf_request()
 
         self.paginator.paginate_queryset(iterable, request)  # Should not raise exception
+
+
+class ORJSONRendererTest(TestCase):
+
+    def test_output_matches_json_renderer(self):
+        data = {
+            'list': [1, 2.5, None, True],
+            'datetime': datetime.datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.timezone.utc),
+            'date': datetime.date(2024, 1, 2),
+            'decimal': decimal.Decimal('1.50'),
+            'uuid': uuid.uuid4(),
+            'unicode': '\u2028\u00e9',
+            1: 'integer key',
+        }
+        for accepted_media_type in (None, 'application/json; indent=4'):
+            self.assertEqual(
+                ORJSONRenderer().render(data, accepted_media_type),
+                JSONRenderer().render(data, accepted_media_type)
+            )
+
+    def test_falls_back_for_unsupported_data(self):
+        data = {'large_integer': 2 ** 70}
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_rejects_non_finite_numbers(self):
+        for value in (float('nan'), float('inf'), decimal.Decimal('NaN')):
+            data = {'value': value, 'other': None}
+            with self.assertRaises(ValueError):
+                JSONRenderer().render(data)
+            with self.assertRaises(ValueError):
+                ORJSONRenderer().render(data)
@@ -10,7 +10,8 @@ class Migration(migrations.Migration):
         # Django admin UI was removed in NetBox v4.0
         # Older installations may still have the old `django_admin_log` table in place
         # Drop the obsolete table if it exists. This is a no-op on fresh or already-clean DBs.
-        # Cleanup (no-op on SQLite)
-        migrations.RunPython(code=migrations.RunPython.noop),
-        migrations.RunPython(code=migrations.RunPython.noop),
+        migrations.RunSQL(
+            sql='DROP TABLE IF EXISTS django_admin_log',
+            reverse_sql=migrations.RunSQL.noop
+        ),
     ]
@@ -11,9 +11,6 @@ class _NoopLock:
     decorator factory (for `@advisory_lock(...)`).
     """
 
-    def __init__(self, key):
-        self.key = key
-
     def __enter__(self):
         return self
 
@@ -21,9 +18,12 @@ class _NoopLock:
         return False
 
     def __call__(self, func):
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        return wrapper
+        # Nothing to lock, so the function is returned undecorated
+        return func
+
+
+# The lock holds no state, so one instance serves every key
+_NOOP_LOCK = _NoopLock()
 
 
 def advisory_lock(key):
@@ -38,4 +38,4 @@ def advisory_lock(key):
     Returns:
         Lock object (context manager or decorator)
     """
-    return _NoopLock(key)
+    return _NOOP_LOCK
@@ -1,15 +1,30 @@
 import decimal
 import re
-from itertools import count, groupby
+
 
 # NumericRange implementation for SQLite
 class NumericRange:
+    __slots__ = ('lower', 'upper', 'lower_inc', 'upper_inc', 'bounds', '_key')
+
+    # Map each bounds string to (lower_inc, upper_inc)
+    _BOUNDS = {
+        '[)': (True, False),
+        '[]': (True, True),
+        '(]': (False, True),
+        '()': (False, False),
+    }
+
     def __init__(self, lower, upper, bounds='[)'):
         self.lower = int(lower)
         self.upper = int(upper)
-        self.lower_inc = bounds.startswith('[')
-        self.upper_inc = bounds.endswith(']')
+        try:
+            self.lower_inc, self.upper_inc = self._BOUNDS[bounds]
+        except KeyError:
+            self.lower_inc = bounds.startswith('[')
+            self.upper_inc = bounds.endswith(']')
         self.bounds = bounds
+        # Identity used for equality and hashing
+        self._key = (self.lower, self.upper, self.lower_inc, self.upper_inc)
 
     def __repr__(self):
         return f"NumericRange({self.lower}, {self.upper}, bounds='{self.bounds}')"
@@ -17,12 +32,10 @@ class NumericRange:
     def __eq__(self, other):
         if not isinstance(other, NumericRange):
             return NotImplemented
-        return (
-            self.lower == other.lower and
-            self.upper == other.upper and
-            self.lower_inc == other.lower_inc and
-            self.upper_inc == other.upper_inc
-        )
+        return self._key == other._key
+
+    def __hash__(self):
+        return hash(self._key)
 
 
 def _coerce_range_like(r):
@@ -80,17 +93,22 @@ def deepmerge(original, new):
     Be tolerant to non-dict input: if `new` is not a dict, return a copy of `original` unchanged.
     """
     # Guard: only merge dicts; anything else is ignored to keep callers resilient to bad data
-    if type(new) is not dict:
+    if not isinstance(new, dict):
         try:
             return dict(original)
         except Exception:
             return {}
     merged = dict(original)
-    for key, val in new.items():
-        if key in original and isinstance(original[key], dict) and val and isinstance(val, dict):
-            merged[key] = deepmerge(original[key], val)
-        else:
-            merged[key] = val
+    # Walk the nested dicts with an explicit stack, copying each level of `original` only where it is merged into
+    stack = [(merged, new)]
+    while stack:
+        dst, src = stack.pop()
+        for key, val in src.items():
+            if val and isinstance(val, dict) and isinstance(dst.get(key), dict):
+                dst[key] = dict(dst[key])
+                stack.append((dst[key], val))
+            else:
+                dst[key] = val
     return merged
 
 
@@ -103,12 +121,18 @@ def flatten_dict(d, prefix='', separator='.'):
     :param separator: The character to use when concatenating key names
     """
     ret = {}
-    for k, v in d.items():
-        key = separator.join([prefix, k]) if prefix else k
-        if type(v) is dict:
-            ret.update(flatten_dict(v, prefix=key, separator=separator))
-        else:
+    # Depth-first walk over a stack of item iterators, so that keys are emitted in the same order as by recursion
+    stack = [(prefix, iter(d.items()))]
+    while stack:
+        parent, items = stack[-1]
+        for k, v in items:
+            key = f'{parent}{separator}{k}' if parent else k
+            if type(v) is dict:
+                stack.append((key, iter(v.items())))
+                break
             ret[key] = v
+        else:
+            stack.pop()
     return ret
 
 
@@ -165,13 +189,17 @@ def array_to_ranges(array):
     if not values:
         return []
 
-    # Sort and group consecutive values
-    group = (
-        list(x) for _, x in groupby(sorted(values), lambda x, c=count(): next(c) - x)
-    )
-    return [
-        (g[0], g[-1])[:len(g)] for g in group
-    ]
+    # Sort, then close a run whenever the next value is not exactly one greater than the previous one
+    values.sort()
+    ranges = []
+    start = prev = values[0]
+    for value in values[1:]:
+        if value != prev + 1:
+            ranges.append((start, prev) if prev != start else (start,))
+            start = value
+        prev = value
+    ranges.append((start, prev) if prev != start else (start,))
+    return ranges
 
 
 def array_to_string(array):
@@ -210,42 +238,74 @@ def drange(start, end, step=decimal.Decimal(1)):
             start += step
 
 
+def _inclusive_bounds(ranges):
+    """
+    Return a list of (lower, upper) inclusive integer bounds for a sequence of range-like items.
+
+    Lists of dicts (as stored in JSONField) and lists of NumericRange-like objects each get a dedicated loop, chosen
+    by the type of the first item; anything else (e.g. mixed lists) is normalized item by item.
+    """
+    try:
+        if isinstance(ranges[0], dict):
+            bounds_map = NumericRange._BOUNDS
+            result = []
+            for r in ranges:
+                lower_inc, upper_inc = bounds_map[r.get('bounds', '[)')]
+                lower, upper = int(r['lower']), int(r['upper'])
+                result.append((lower if lower_inc else lower + 1, upper if upper_inc else upper - 1))
+            return result
+        return [
+            (
+                int(r.lower) if r.lower_inc else int(r.lower) + 1,
+                int(r.upper) if r.upper_inc else int(r.upper) - 1,
+            ) for r in ranges
+        ]
+    except (AttributeError, KeyError, TypeError):
+        pass
+
+    result = []
+    for r in ranges:
+        lower, upper, lower_inc, upper_inc = _coerce_range_like(r)
+        result.append((lower if lower_inc else lower + 1, upper if upper_inc else upper - 1))
+    return result
+
+
+# Ranges within [0, _OVERLAP_BITMAP_SIZE) are checked for overlap using a bitmap
+_OVERLAP_BITMAP_SIZE = 4096
+
+
 def check_ranges_overlap(ranges):
     """
-    Check for overlap in an iterable of range-like objects using half-open semantics.
+    Check for overlap in an iterable of range-like objects.
 
     Accepts either NumericRange instances or dicts with keys lower/upper/bounds
-    (as produced by JSONField under SQLite). Treat each range as
-    [lower_inclusive, upper_exclusive). Two ranges overlap if
-    prev_upper_exclusive > curr_lower_inclusive after sorting by lower.
+    (as produced by JSONField under SQLite). Each range is reduced to inclusive
+    integer bounds; after sorting by lower bound, two ranges overlap if the
+    farthest upper bound seen so far reaches the next lower bound.
     """
     if not ranges:
         return False
 
-    # Coerce to comparable tuples without mutating originals
-    coerced = [
-        _coerce_range_like(r) for r in ranges
-    ]
-
-    def lower_inclusive(t):
-        lower, _upper, lower_inc, _upper_inc = t
-        return lower if lower_inc else lower + 1
+    bounds = _inclusive_bounds(list(ranges))
 
-    def upper_exclusive(t):
-        _lower, upper, _lower_inc, upper_inc = t
-        return upper + 1 if upper_inc else upper
-
-    coerced.sort(key=lambda t: (lower_inclusive(t), t[1]))
+    # Small non-negative ranges (e.g. VLAN IDs) are checked against an integer bitmap: no sorting, one AND/OR each
+    if all(0 <= lower <= upper < _OVERLAP_BITMAP_SIZE for lower, upper in bounds):
+        mask = 0
+        for lower, upper in bounds:
+            span = ((1 << (upper - lower + 1)) - 1) << lower
+            if mask & span:
+                return True
+            mask |= span
+        return False
 
-    prev_upper_ex = upper_exclusive(coerced[0])
-    for t in coerced[1:]:
-        curr_lower_in = lower_inclusive(t)
-        if prev_upper_ex > curr_lower_in:
+    bounds.sort()
+    prev_upper = bounds[0][1]
+    for lower, upper in bounds[1:]:
+        if prev_upper >= lower:
             return True
         # track farthest upper to catch nested overlaps
-        t_upper_ex = upper_exclusive(t)
-        if t_upper_ex > prev_upper_ex:
-            prev_upper_ex = t_upper_ex
+        if upper > prev_upper:
+            prev_upper = upper
     return False
 
 
@@ -264,14 +324,10 @@ def ranges_to_string_list(ranges):
     if not ranges:
         return []
 
-    output: list[str] = []
-    for r in ranges:
-        lower, upper, lower_inc, upper_inc = _coerce_range_like(r)
-        # Compute inclusive bounds regardless of how the DB range is stored.
-        lower_inc_v = lower if lower_inc else lower + 1
-        upper_inc_v = upper if upper_inc else upper - 1
-        output.append(f"{lower_inc_v}-{upper_inc_v}" if lower_inc_v != upper_inc_v else str(lower_inc_v))
-    return output
+    return [
+        f"{lower}-{upper}" if lower != upper else str(lower)
+        for lower, upper in _inclusive_bounds(ranges)
+    ]
 
 
 def ranges_to_string(ranges):
@@ -293,6 +349,10 @@ def ranges_to_string(ranges):
     return ','.join(ranges_to_string_list(ranges))
 
 
+# A single integer or a dash-separated pair of integers
+_RANGE_RE = re.compile(r'(\d+)(?:-(\d+))?')
+
+
 def string_to_ranges(value):
     """
     Converts a string representation of numeric ranges into a list of NumericRange objects.
@@ -308,19 +368,13 @@ def string_to_ranges(value):
     """
     if not value:
         return None
-    value.replace(' ', '')  # Remove whitespace
+    value = value.replace(' ', '')  # Remove whitespace
     values = []
     for data in value.split(','):
-        dash_range = data.strip().split('-')
-        if len(dash_range) == 1 and str(dash_range[0]).isdigit():
-            # Single integer value; expand to a range
-            lower = dash_range[0]
-            upper = dash_range[0]
-        elif len(dash_range) == 2 and str(dash_range[0]).isdigit() and str(dash_range[1]).isdigit():
-            # The range has two values and both are valid integers
-            lower = dash_range[0]
-            upper = dash_range[1]
-        else:
+        match = _RANGE_RE.fullmatch(data.strip())
+        if match is None:
             return None
-        values.append(NumericRange(int(lower), int(upper) + 1, bounds='[)'))
+        # A single integer value is expanded to a range
+        lower, upper = match.groups()
+        values.append(NumericRange(int(lower), int(upper or lower) + 1, bounds='[)'))
     return values
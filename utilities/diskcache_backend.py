@@ -8,8 +8,11 @@ from __future__ import annotations
 
 import uuid
 import os
+from collections import deque
 import logging
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional
 from pathlib import Path
 
@@ -22,8 +25,38 @@ logger = logging.getLogger(__name__)
 _CACHE_DIR = Path(os.environ.get('DISKCACHE_DIR', '/tmp/netbox_cache'))
 _CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# SQLite durability of every store, set via the DISKCACHE_DURABILITY environment variable. 'fast' skips fsync and keeps
+# the rollback journal in memory: writes are much cheaper, but a crash may lose or corrupt data, so it is meant for
+# tests and development only. Both modes are applied explicitly, since diskcache persists these settings in each store.
+_SQLITE_SETTINGS = {
+    'durable': {'sqlite_synchronous': 1, 'sqlite_journal_mode': 'wal'},
+    'fast': {'sqlite_synchronous': 0, 'sqlite_journal_mode': 'memory'},
+}
+_DURABILITY = os.environ.get('DISKCACHE_DURABILITY', 'durable')
+if _DURABILITY not in _SQLITE_SETTINGS:
+    raise ValueError(
+        f"Invalid DISKCACHE_DURABILITY {_DURABILITY!r}; must be one of: {', '.join(_SQLITE_SETTINGS)}"
+    )
+
+
+def _open_store(directory: Path, **settings: Any) -> diskcache.Cache:
+    """Open a diskcache.Cache in the given directory with the configured durability."""
+    return diskcache.Cache(str(directory), **settings, **_SQLITE_SETTINGS[_DURABILITY])
+
+
+def _open_index(directory: Path) -> diskcache.Index:
+    return diskcache.Index.fromcache(_open_store(directory, eviction_policy='none'))
+
+
+def _open_deque(directory: Path) -> diskcache.Deque:
+    return diskcache.Deque.fromcache(_open_store(directory, eviction_policy='none'))
+
+
 # Main cache instance
-_cache = diskcache.Cache(str(_CACHE_DIR / 'main'))
+_cache = _open_store(_CACHE_DIR / 'main')
+
+# Job ID -> queue name index, so jobs can be located without searching every queue
+_JOB_INDEX = _open_index(_CACHE_DIR / 'job_index')
 
 
 class CacheConnection:
@@ -36,16 +69,22 @@ class CacheConnection:
         for queue in _QUEUES.values():
             queue._jobs.clear()
             queue._deque.clear()
+        _JOB_INDEX.clear()
         
         for index in _REGISTRIES.values():
             index.clear()
         _REGISTRIES.clear()
+        _invalidate_statistics()
         
         self._cache.clear()
     
     def __getattr__(self, name):
         """Proxy all other methods to the underlying cache."""
-        return getattr(self._cache, name)
+        value = getattr(self._cache, name)
+        if callable(value):
+            # Keep the bound method on the wrapper, so later lookups don't fall back to __getattr__
+            setattr(self, name, value)
+        return value
 
 
 # Create connection wrapper
@@ -53,23 +92,26 @@ _connection = CacheConnection(_cache)
 
 
 class Queue:
-    """Queue implementation using diskcache.Deque for persistence."""
+    """Queue implementation using diskcache.Deque for ordering and diskcache.Index for job storage."""
+    __slots__ = ('name', '_jobs', 'connection', 'serializer', '_deque')
     
     def __init__(self, name: str = "default") -> None:
         self.name = name
-        self._jobs: Dict[str, Job] = {}  # In-memory job storage
+        # Jobs are stored on disk by ID, so they are shared between processes
+        self._jobs: diskcache.Index = _open_index(_CACHE_DIR / f'jobs_{name}')
         self.connection = _connection
         self.serializer = None
-        self._deque = diskcache.Deque(directory=str(_CACHE_DIR / f'queue_{name}'))
+        self._deque = _open_deque(_CACHE_DIR / f'queue_{name}')
 
     @property
     def jobs(self) -> List[Job]:
         """Return jobs in FIFO order."""
-        return [self._jobs[job_id] for job_id in self._deque if job_id in self._jobs]
+        return [job for job_id in self._deque if (job := self._jobs.get(job_id)) is not None]
 
     @property
     def count(self) -> int:
-        return len(self._jobs)
+        """Return the number of jobs waiting to be run."""
+        return len(self._deque)
 
     def enqueue(self, func: Any, *args: Any, **kwargs: Any) -> Job:
         depends_on = kwargs.pop('depends_on', None)
@@ -80,17 +122,27 @@ class Queue:
         job.kwargs = kwargs
         job.set_status(JobStatus.DEFERRED if depends_on else JobStatus.QUEUED, persist=False)
         
+        # Index the job only once it has been stored (pickling it may fail)
         self._jobs[job.id] = job
+        _JOB_INDEX[job.id] = self.name
         self._deque.append(job.id)
+        _invalidate_statistics()
         
         logger.info(f"Job {job.id} enqueued to queue {self.name}: {func}")
         
         return job
 
+    def enqueue_many(self, job_datas: Iterable[tuple]) -> List[Job]:
+        """Enqueue several jobs, given as (func, args, kwargs) tuples, committing them to disk together."""
+        # The job index is part of the batch too, so a failing job leaves no index entries for the rolled back ones
+        with self._jobs.transact(), _JOB_INDEX.transact(), self._deque.transact():
+            return [self.enqueue(func, *args, **kwargs) for func, args, kwargs in job_datas]
+
     def enqueue_at(self, schedule_at: Any, func: Any, *args: Any, **kwargs: Any) -> Job:
         """Schedule a job to run at a specific time."""
         job = self.enqueue(func, *args, **kwargs)
         job.scheduled_at = schedule_at
+        job.save()
         scheduled_registry = ScheduledJobRegistry(self.name, connection=self.connection)
         scheduled_registry.add(job)
         return job
@@ -99,51 +151,105 @@ class Queue:
         """Fetch a job by ID."""
         return self._jobs.get(job_id)
 
+    def remove(self, job_or_id: Any) -> None:
+        """Remove a job from the queue."""
+        job_id = job_or_id.id if hasattr(job_or_id, 'id') else str(job_or_id)
+        self._forget((job_id,))
+        try:
+            self._deque.remove(job_id)
+        except ValueError:
+            pass  # Already run
+        _invalidate_statistics()
+
+    def _forget(self, job_ids: Iterable[str]) -> None:
+        """Drop jobs from the job store and index, leaving the queue itself untouched."""
+        with self._jobs.transact(), _JOB_INDEX.transact():
+            for job_id in job_ids:
+                self._jobs.pop(job_id, None)
+                _JOB_INDEX.pop(job_id, None)
+
+    def requeue(self, job_id: str) -> Job:
+        """Mark a stored job as queued and put it back at the end of the queue, so the next worker run executes it."""
+        job = self.fetch_job(job_id)
+        if job is None:
+            raise NoSuchJobError(f"Job {job_id} not found")
+        with self._jobs.transact(), self._deque.transact():
+            job.set_status(JobStatus.QUEUED)
+            # A job that has not run yet (e.g. a deferred one) is still on the queue
+            if job_id not in self._deque:
+                self._deque.append(job_id)
+        _invalidate_statistics()
+        return job
+
     @property
     def job_ids(self) -> List[str]:
-        """Get list of job IDs."""
-        return list(self._jobs.keys())
+        """Get list of IDs of the jobs waiting to be run, in FIFO order."""
+        return list(self._deque)
 
     def empty(self) -> None:
         """Clear all jobs."""
+        for job_id in self._jobs:
+            _JOB_INDEX.pop(job_id, None)
         self._jobs.clear()
         self._deque.clear()
+        _invalidate_statistics()
 
     def get_jobs(self) -> List[Job]:
         """Compatibility method."""
         return self.jobs
 
 
+# Names of the configured queues, in index order
+QUEUE_NAMES = ('default', 'high', 'low')
+
 # Global queues registry
 _QUEUES: Dict[str, Queue] = {}
 
 
 def get_queue(name: str = "default") -> Queue:
     """Get or create a queue by name (singleton pattern)."""
-    if name not in _QUEUES:
-        _QUEUES[name] = Queue(name)
-    return _QUEUES[name]
+    queue = _QUEUES.get(name)
+    if queue is None:
+        queue = _QUEUES[name] = Queue(name)
+    return queue
+
+
+def _find_job(job_id: str) -> Optional['Job']:
+    """Return the job with the given ID from the queue it was enqueued to, or None."""
+    queue_name = _JOB_INDEX.get(job_id)
+    if queue_name is None:
+        return None
+    return get_queue(queue_name).fetch_job(job_id)
+
+
+def get_queue_by_index(index: int) -> Queue:
+    """Get a queue by index (0=default, 1=high, 2=low)."""
+    return get_queue(QUEUE_NAMES[index] if 0 <= index < len(QUEUE_NAMES) else 'default')
 
 
 def get_worker(queue_name: str = "default", name: Optional[str] = None, **kwargs) -> 'Worker':
     """Get or create a worker for the given queue."""
-    queue = get_queue(queue_name)
     worker_name = name or queue_name
-    worker_key = f'rq:worker:{worker_name}'
-    if worker_key not in _WORKERS:
-        worker = Worker([queue], name=worker_name)
-        _WORKERS[worker_key] = worker
-    else:
-        worker = _WORKERS[worker_key]
+    worker = _WORKERS.get(f'rq:worker:{worker_name}')
+    if worker is None:
+        # New workers add themselves to _WORKERS
+        worker = Worker([get_queue(queue_name)], name=worker_name)
     return worker
 
 
 # Global workers registry
 _WORKERS: Dict[str, 'Worker'] = {}
 
+# Number of inline-run jobs each worker keeps in completed_jobs
+_COMPLETED_JOBS_MAXLEN = 1000
+
 
 class Worker:
     """Worker for executing jobs from queues."""
+    __slots__ = (
+        'queues', 'name', 'connection', 'birth_date', 'key', 'total_working_time', '_current_job', 'state',
+        'successful_job_count', 'failed_job_count', 'pid', 'completed_jobs',
+    )
     
     def __init__(self, queues: Iterable[Queue], name: Optional[str] = None, connection: Any = None):
         self.queues = list(queues)
@@ -157,28 +263,50 @@ class Worker:
         self.successful_job_count = 0
         self.failed_job_count = 0
         self.pid = str(uuid.uuid4().int)[:5]
+        # The most recent jobs run with inline=True, holding their outcome
+        self.completed_jobs = deque(maxlen=_COMPLETED_JOBS_MAXLEN)
         _WORKERS[self.key] = self
 
     def work(self, *args: Any, **kwargs: Any) -> None:
-        """Execute jobs from the queue if burst=True."""
+        """Execute jobs from the queue if burst=True.
+
+        With inline=True, job outcomes are not written back to the job store. Each job is appended, with its status
+        and result set, to completed_jobs, and the jobs run from each queue are dropped from storage together.
+        """
         if not kwargs.get('burst', False):
             return
+        persist = not kwargs.get('inline', False)
         
         logger.info(f"Worker {self.name} starting to process jobs")
         
         for queue in self.queues:
             logger.info(f"Processing queue: {queue.name}")
-            for job in list(queue.jobs):
+            inline_job_ids = []
+            # Pop each job off the queue as it is run; the job itself stays stored so its outcome can be fetched
+            while True:
+                try:
+                    job_id = queue._deque.popleft()
+                except IndexError:
+                    break
+                job = queue.fetch_job(job_id)
+                if job is None:
+                    continue  # Removed after being enqueued
                 try:
                     logger.info(f"Executing job {job.id}: {job.func}")
                     if callable(job.func):
                         job.result = job.func(*job.args, **job.kwargs)
-                    job.set_status(JobStatus.FINISHED)
+                    job.set_status(JobStatus.FINISHED, persist=persist)
                     logger.info(f"Job {job.id} completed successfully")
                 except Exception as e:
                     logger.error(f"Job {job.id} failed with error: {e}", exc_info=True)
                     job.exc_info = str(e)
-                    job.set_status(JobStatus.FAILED)
+                    job.set_status(JobStatus.FAILED, persist=persist)
+                if not persist:
+                    inline_job_ids.append(job.id)
+                    self.completed_jobs.append(job)
+            if inline_job_ids:
+                # Otherwise the stored jobs would stay queued forever
+                queue._forget(inline_job_ids)
         
         logger.info(f"Worker {self.name} finished processing jobs")
 
@@ -270,9 +398,25 @@ class JobStatus:
     STATUS_CANCELED = 'canceled'
 
 
+# The same callables are enqueued over and over, so their descriptions are cached
+@lru_cache(maxsize=256)
+def _describe_func(func):
+    """Return the (func_name, description) of a job's callable or dotted path."""
+    if isinstance(func, str):
+        return f"{func}()", func
+    module = getattr(func, '__module__', '')
+    qualname = getattr(func, '__qualname__', getattr(func, '__name__', str(func)))
+    return (f"{module}.{qualname}()", f"{module}.{qualname}") if module else (f"{qualname}()", qualname)
+
+
 # Job implementation
 class Job:
     """Job implementation for task queue."""
+    __slots__ = (
+        'id', 'connection', 'origin', 'status', 'created_at', 'enqueued_at', 'started_at', 'ended_at', 'result',
+        'exc_info', 'func', 'func_name', 'description', 'args', 'kwargs', 'serializer', '_exc_info',
+        '_dependency_id', 'timeout', 'result_ttl', 'worker_name', 'meta', 'last_heartbeat', 'scheduled_at',
+    )
     
     def __init__(self, id=None, connection=None, origin=None, func=None):
         self.id = id or uuid.uuid4().hex
@@ -289,10 +433,11 @@ class Job:
         
         # Build func_name
         if func:
-            module = getattr(func, '__module__', '')
-            qualname = getattr(func, '__qualname__', getattr(func, '__name__', str(func)))
-            self.func_name = f"{module}.{qualname}()" if module else f"{qualname}()"
-            self.description = f"{module}.{qualname}" if module else qualname
+            try:
+                self.func_name, self.description = _describe_func(func)
+            except TypeError:
+                # Unhashable callable; describe it without caching
+                self.func_name, self.description = _describe_func.__wrapped__(func)
         else:
             self.func_name = 'unknown'
             self.description = 'unknown'
@@ -308,7 +453,28 @@ class Job:
         self.meta = {}
         self.last_heartbeat = ''
 
-    def get_status(self):
+    def __getstate__(self):
+        # The connection wraps an open cache and is restored on load
+        return {
+            name: getattr(self, name) for name in self.__slots__
+            if name != 'connection' and hasattr(self, name)
+        }
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.connection = _connection
+
+    def save(self):
+        """Store the job in the queue it was enqueued to."""
+        get_queue(self.origin)._jobs[self.id] = self
+
+    def get_status(self, refresh=True):
+        """Return the job status, re-reading it from storage unless refresh is False."""
+        if refresh:
+            stored = get_queue(self.origin).fetch_job(self.id)
+            if stored is not None:
+                self.status = stored.status
         return self.status
 
     def set_status(self, status, persist=True):
@@ -321,58 +487,58 @@ class Job:
             self.started_at = now
         elif status in (JobStatus.FINISHED, JobStatus.FAILED, JobStatus.STOPPED, JobStatus.CANCELED):
             self.ended_at = now
+        if persist:
+            self.save()
     
     def get_position(self):
         return -1
 
     @property
     def is_failed(self):
-        return self.status == JobStatus.FAILED
+        return self.get_status() == JobStatus.FAILED
     
     @property
     def is_finished(self):
-        return self.status == JobStatus.FINISHED
+        return self.get_status() == JobStatus.FINISHED
     
     @property
     def is_queued(self):
-        return self.status == JobStatus.QUEUED
+        return self.get_status() == JobStatus.QUEUED
     
     @property
     def is_started(self):
-        return self.status == JobStatus.STARTED
+        return self.get_status() == JobStatus.STARTED
     
     @property
     def is_deferred(self):
-        return self.status == JobStatus.DEFERRED
+        return self.get_status() == JobStatus.DEFERRED
     
     @property
     def is_canceled(self):
-        return self.status == JobStatus.CANCELED
+        return self.get_status() == JobStatus.CANCELED
     
     @property
     def is_scheduled(self):
-        return self.status == JobStatus.SCHEDULED
+        return self.get_status() == JobStatus.SCHEDULED
     
     @property
     def is_stopped(self):
-        return self.status == JobStatus.STOPPED
+        return self.get_status() == JobStatus.STOPPED
 
     @staticmethod
     def fetch(job_id, connection=None):
-        """Fetch a job by ID from queues."""
-        for queue in _QUEUES.values():
-            job = queue.fetch_job(job_id)
-            if job:
-                return job
-        return None
+        """Fetch a job by ID from the queue it was enqueued to."""
+        return _find_job(job_id)
+
+    @staticmethod
+    def fetch_many(job_ids, connection=None, serializer=None):
+        """Fetch several jobs by ID; missing jobs are returned as None."""
+        return [_find_job(job_id) for job_id in job_ids]
 
     @staticmethod
     def exists(job_id, connection=None):
         """Check if job exists."""
-        for queue in _QUEUES.values():
-            if job_id in queue._jobs:
-                return True
-        return False
+        return job_id in _JOB_INDEX
 
 
 # Global registries storage
@@ -389,12 +555,10 @@ class BaseRegistry:
         registry_type = self.__class__.__name__
         registry_key = f'{registry_type}:{name}'
         
-        if registry_key not in _REGISTRIES:
-            index_dir = _CACHE_DIR / 'registries' / registry_key
-            index_dir.mkdir(parents=True, exist_ok=True)
-            _REGISTRIES[registry_key] = diskcache.Index(str(index_dir))
-        
-        self._index = _REGISTRIES[registry_key]
+        self._index = _REGISTRIES.get(registry_key)
+        if self._index is None:
+            # diskcache creates the directory (and any parents) if needed
+            self._index = _REGISTRIES[registry_key] = _open_index(_CACHE_DIR / 'registries' / registry_key)
 
     def get_job_ids(self):
         """Get all job IDs from the registry."""
@@ -403,12 +567,15 @@ class BaseRegistry:
     def add(self, job_or_id, ttl: int = -1):
         """Add a job ID to the registry."""
         job_id = job_or_id.id if hasattr(job_or_id, 'id') else str(job_or_id)
-        self._index[job_id] = True
+        # Only membership matters; an int is stored as a plain SQLite value, where True would be pickled
+        self._index[job_id] = 1
+        _invalidate_statistics()
 
     def remove(self, job_id: str):
         """Remove a job ID from the registry."""
         if job_id in self._index:
             del self._index[job_id]
+            _invalidate_statistics()
 
     def __len__(self):
         return len(self._index)
@@ -460,6 +627,16 @@ def job(*dargs: Any, **dkwargs: Any):
     return _wrap
 
 
+def _retry(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for rq.Retry; failed jobs are not retried, so there is no retry policy."""
+    return None
+
+
+def _get_jobs(queue: Queue, job_ids: Iterable[str], registry: Any) -> List[Job]:
+    """Get the jobs with the given IDs from a queue, skipping any that no longer exist."""
+    return [job for job_id in job_ids if (job := queue.fetch_job(job_id))]
+
+
 def _get_queue_statistics(queue_name: str, queue_index: int) -> Dict[str, Any]:
     """Get statistics for a single queue."""
     queue = get_queue(queue_name)
@@ -485,6 +662,38 @@ def _get_queue_statistics(queue_name: str, queue_index: int) -> Dict[str, Any]:
     }
 
 
+# Queue statistics are cached briefly, since status pages poll them on every load. The cache is per process: local
+# changes to queues and registries invalidate it, while changes made by other processes show up once it expires.
+_STATISTICS_TTL = 2
+_statistics_cache: Optional[tuple] = None
+
+
+def _invalidate_statistics() -> None:
+    global _statistics_cache
+    _statistics_cache = None
+
+
+def _get_statistics(queues: Iterable[tuple]) -> Dict[str, Any]:
+    """Get statistics for the given (name, index) queues, reusing results computed within the last few seconds."""
+    global _statistics_cache
+    now = time.monotonic()
+    if _statistics_cache is None or _statistics_cache[0] <= now:
+        queues_data = [_get_queue_statistics(name, index) for name, index in queues]
+        _statistics_cache = (now + _STATISTICS_TTL, {
+            'workers': 1,
+            'queues': queues_data,
+            'jobs': sum(q['jobs'] for q in queues_data),
+        })
+    statistics = _statistics_cache[1]
+    # Hand out copies so callers (e.g. table sorting) cannot alter the cached result
+    return {**statistics, 'queues': [dict(q) for q in statistics['queues']]}
+
+
+def _stop_jobs(queue: Queue, job_id: str):
+    """Jobs run in-process and cannot be interrupted, so stopping them is not supported."""
+    raise NotImplementedError("Stopping jobs is not supported by the diskcache queue backend.")
+
+
 def _setup_fake_modules():
     """Create compatibility shims for rq and django_rq modules."""
     import sys
@@ -493,7 +702,7 @@ def _setup_fake_modules():
     # Create rq package
     rq_module = types.ModuleType('rq')
     rq_module.Worker = Worker
-    rq_module.Retry = lambda *args, **kwargs: None
+    rq_module.Retry = _retry
     sys.modules['rq'] = rq_module
     
     # Create rq submodules
@@ -533,7 +742,7 @@ def _setup_fake_modules():
     django_rq_module.get_queue = get_queue
     django_rq_module.get_connection = get_connection
     django_rq_module.get_redis_connection = get_redis_connection
-    django_rq_module.job = lambda *args, **kwargs: lambda func: func
+    django_rq_module.job = job
     sys.modules['django_rq'] = django_rq_module
     
     # Create django_rq submodules
@@ -544,43 +753,28 @@ def _setup_fake_modules():
     django_rq_queues_module = types.ModuleType('django_rq.queues')
     django_rq_queues_module.get_connection = get_connection
     django_rq_queues_module.get_redis_connection = get_redis_connection
-    django_rq_queues_module.get_queue_by_index = lambda index: get_queue(
-        {0: 'default', 1: 'high', 2: 'low'}.get(index, 'default')
-    )
+    django_rq_queues_module.get_queue_by_index = get_queue_by_index
+    django_rq_queues_module.QUEUE_NAMES = QUEUE_NAMES
     sys.modules['django_rq.queues'] = django_rq_queues_module
     
     # Create django_rq.settings submodule
     django_rq_settings_module = types.ModuleType('django_rq.settings')
-    django_rq_settings_module.QUEUES_LIST = [
-        {'name': 'default', 'connection_config': {}},
-        {'name': 'high', 'connection_config': {}},
-        {'name': 'low', 'connection_config': {}},
-    ]
-    django_rq_settings_module.QUEUES_MAP = {'default': 0, 'high': 1, 'low': 2}
+    django_rq_settings_module.QUEUES_LIST = [{'name': name, 'connection_config': {}} for name in QUEUE_NAMES]
+    django_rq_settings_module.QUEUES_MAP = {name: i for i, name in enumerate(QUEUE_NAMES)}
+    django_rq_settings_module.QUEUES_RESOLVED = tuple(
+        (config['name'], django_rq_settings_module.QUEUES_MAP.get(config['name'], i))
+        for i, config in enumerate(django_rq_settings_module.QUEUES_LIST)
+    )
     sys.modules['django_rq.settings'] = django_rq_settings_module
     
     # Create django_rq.utils submodule
     django_rq_utils_module = types.ModuleType('django_rq.utils')
     
-    def _get_statistics(*args, **kwargs):
-        queues_data = [
-            _get_queue_statistics(
-                queue_config['name'],
-                django_rq_settings_module.QUEUES_MAP.get(queue_config['name'], i)
-            )
-            for i, queue_config in enumerate(django_rq_settings_module.QUEUES_LIST)
-        ]
-        return {
-            'workers': 1,
-            'queues': queues_data,
-            'jobs': sum(q['jobs'] for q in queues_data),
-        }
-    
-    django_rq_utils_module.get_statistics = _get_statistics
-    django_rq_utils_module.get_jobs = lambda queue, job_ids, registry: [
-        job for job_id in job_ids if (job := queue.fetch_job(job_id))
-    ]
-    django_rq_utils_module.stop_jobs = lambda queue, job_id: [0]
+    django_rq_utils_module.get_statistics = lambda *args, **kwargs: _get_statistics(
+        django_rq_settings_module.QUEUES_RESOLVED
+    )
+    django_rq_utils_module.get_jobs = _get_jobs
+    django_rq_utils_module.stop_jobs = _stop_jobs
     sys.modules['django_rq.utils'] = django_rq_utils_module
 
 
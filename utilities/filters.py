@@ -1,3 +1,6 @@
+import operator
+from functools import lru_cache, reduce
+
 import django_filters
 from django import forms
 from django.conf import settings
@@ -6,7 +9,9 @@ from django_filters.constants import EMPTY_VALUES
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
 from django.db import models as _models
-from django.db.models import F, Value, Func, FloatField, CharField, Q
+from django.db.models import CharField, F, FloatField, Func, IntegerField, Q, Value
+
+from utilities.query_functions import JSONExtract, JSONIsEmpty
 
 __all__ = (
     'ContentTypeFilter',
@@ -27,21 +32,24 @@ __all__ = (
 )
 
 
+@lru_cache(maxsize=None)
 def multivalue_field_factory(field_class):
     """
     Given a form field class, return a subclass capable of accepting multiple values. This allows us to OR on multiple
     filter values while maintaining the field's built-in validation. Example: GET /api/dcim/devices/?name=foo&name=bar
     """
+    # A default instance of the base field converts each individual value; to_python() does not modify it
+    base_field = field_class()
+
     class NewField(field_class):
         widget = forms.SelectMultiple
 
         def to_python(self, value):
             if not value:
                 return []
-            field = field_class()
             return [
                 # Only append non-empty values (this avoids e.g. trying to cast '' as an integer)
-                field.to_python(v) for v in value if v
+                base_field.to_python(v) for v in value if v
             ]
 
         def run_validators(self, value):
@@ -55,6 +63,30 @@ def multivalue_field_factory(field_class):
     return type(f'MultiValue{field_class.__name__}', (NewField,), dict())
 
 
+@lru_cache(maxsize=None)
+def _column_sql(model, field_name):
+    """
+    Return the quoted, table-qualified column of a model field, for use in raw SQL.
+    """
+    field = model._meta.get_field(field_name)
+    return f'"{model._meta.db_table}"."{field.column}"'
+
+
+def _split_null_token(values):
+    """
+    Separate the 'null' token (in any case) from the given filter values. Returns the remaining values and whether the
+    token was present.
+    """
+    clean_values = []
+    has_null_token = False
+    for v in values:
+        if isinstance(v, str) and v.lower() == 'null':
+            has_null_token = True
+        else:
+            clean_values.append(v)
+    return clean_values, has_null_token
+
+
 #
 # Filters
 #
@@ -64,6 +96,23 @@ class MultiValueCharFilter(django_filters.MultipleChoiceFilter):
     field_class = multivalue_field_factory(forms.CharField)
 
 
+# Maps JSONKeyCharFilter lookup expressions to Q field lookups
+_JSONKEY_LOOKUP_MAP = {
+    'exact': '_json_txt__in',
+    'in': '_json_txt__in',
+    'icontains': '_json_txt__icontains',
+    'ic': '_json_txt__icontains',
+    'istartswith': '_json_txt__istartswith',
+    'startswith': '_json_txt__istartswith',
+    'isw': '_json_txt__istartswith',
+    'iendswith': '_json_txt__iendswith',
+    'endswith': '_json_txt__iendswith',
+    'iew': '_json_txt__iendswith',
+    'iexact': '_json_txt__iexact',
+    'ie': '_json_txt__iexact',
+}
+
+
 class JSONKeyCharFilter(django_filters.MultipleChoiceFilter):
     """
     Char filter for a string value stored at JSONField key.
@@ -82,39 +131,22 @@ class JSONKeyCharFilter(django_filters.MultipleChoiceFilter):
         if not self.json_key:
             return super().filter(qs, value)
         
-        from django.db import models as _models
-        from django.db.models import F, Value, Func, CharField, Q
-        
         field_name = self.field_name
         json_path = f'$.{self.json_key}'
         jtype = Func(F(field_name), Value(json_path), function='json_type', output_field=CharField())
         jraw = Func(F(field_name), Value(json_path), function='json_extract', output_field=_models.TextField())
         jtxt = _models.functions.Cast(jraw, CharField())
-        qs = qs.annotate(_json_type=jtype, _json_txt=jtxt)
+        # alias() rather than annotate(): the expressions are only needed for filtering, not in the SELECT list
+        qs = qs.alias(_json_type=jtype, _json_txt=jtxt)
         
         vals = value if isinstance(value, (list, tuple)) else [value]
-        vals = [str(v) for v in vals]
+        # Repeated values would only add redundant conditions
+        vals = list(dict.fromkeys(str(v) for v in vals))
         guard = Q(_json_type='text')
         lookup = getattr(self, 'lookup_expr', 'exact') or 'exact'
         cond = Q()
         
-        # Map lookup expressions to Q field lookups
-        lookup_map = {
-            'exact': '_json_txt__in',
-            'in': '_json_txt__in',
-            'icontains': '_json_txt__icontains',
-            'ic': '_json_txt__icontains',
-            'istartswith': '_json_txt__istartswith',
-            'startswith': '_json_txt__istartswith',
-            'isw': '_json_txt__istartswith',
-            'iendswith': '_json_txt__iendswith',
-            'endswith': '_json_txt__iendswith',
-            'iew': '_json_txt__iendswith',
-            'iexact': '_json_txt__iexact',
-            'ie': '_json_txt__iexact',
-        }
-        
-        field_lookup = lookup_map.get(lookup, '_json_txt__in')
+        field_lookup = _JSONKEY_LOOKUP_MAP.get(lookup, '_json_txt__in')
         
         if lookup in ('exact', 'in'):
             cond = Q(**{field_lookup: vals})
@@ -149,16 +181,12 @@ class JSONDateFilter(django_filters.MultipleChoiceFilter):
         if not self.json_key:
             return super().filter(qs, value)
         
-        field_name = self.field_name
-        model = qs.model
-        field = model._meta.get_field(field_name)
-        table = model._meta.db_table
-        column = f'"{table}"."{field.column}"'
+        column = _column_sql(qs.model, self.field_name)
         json_path = f'$.{self.json_key}'
         lookup = getattr(self, 'lookup_expr', 'exact') or 'exact'
         negate = bool(getattr(self, 'exclude', False))
         values = value if isinstance(value, (list, tuple)) else [value]
-        values = [str(v) for v in values]
+        values = list(dict.fromkeys(str(v) for v in values))
 
         not_null_clause = f"json_extract({column}, ?) IS NOT NULL"
         cast_expr = f"CAST(json_extract({column}, ?) AS TEXT)"
@@ -245,7 +273,8 @@ class _JSONNumericFilterMixin:
         jtype = Func(F(field_name), Value(json_path), function='json_type', output_field=CharField())
         jraw = Func(F(field_name), Value(json_path), function='json_extract', output_field=_models.TextField())
         jnum = _models.functions.Cast(jraw, FloatField())
-        qs = qs.annotate(_json_type=jtype, _json_num=jnum)
+        # alias() rather than annotate(): the expressions are only needed for filtering, not in the SELECT list
+        qs = qs.alias(_json_type=jtype, _json_num=jnum)
 
         values = value if isinstance(value, (list, tuple)) else [value]
         nums = []
@@ -256,6 +285,7 @@ class _JSONNumericFilterMixin:
                 continue
         if not nums:
             return qs.none()
+        nums = list(dict.fromkeys(nums))
 
         guard = Q(_json_type__in=['real', 'integer'])
         lookup = getattr(self, 'lookup_expr', 'exact') or 'exact'
@@ -317,12 +347,9 @@ class MultiValueArrayFilter(django_filters.MultipleChoiceFilter):
     def filter(self, qs, value):
         if value in EMPTY_VALUES:
             return qs
-        values = list(value)
-        has_null_token = any(isinstance(v, str) and v.lower() == 'null' for v in values)
         # Remove 'null' token from values passed to default handler
-        clean_values = [v for v in values if not (isinstance(v, str) and v.lower() == 'null')]
+        clean_values, has_null_token = _split_null_token(value)
 
-        from django.db.models import Q
         base_qs = qs
         if has_null_token:
             # Match either explicit JSON null (contains [None]) or field is NULL
@@ -362,31 +389,25 @@ class JSONKeyArrayFilter(django_filters.MultipleChoiceFilter):
         if value in EMPTY_VALUES:
             return qs
         
-        values = list(value)
-        has_null_token = any(isinstance(v, str) and v.lower() == 'null' for v in values)
-        clean_values = [v for v in values if not (isinstance(v, str) and v.lower() == 'null')]
+        clean_values, has_null_token = _split_null_token(value)
 
         if not self.json_key:
             if clean_values:
                 return super().filter(qs, clean_values)
             return qs
         
-        model = qs.model
-        field = model._meta.get_field(self.field_name)
-        table = model._meta.db_table
-        column = f'"{table}"."{field.column}"'
+        column = _column_sql(qs.model, self.field_name)
         json_path = f'$.{self.json_key}'
         where_parts = []
         params = []
         
         if clean_values:
-            clauses = []
-            for s in clean_values:
-                clauses.append(
-                    f"EXISTS (SELECT 1 FROM json_each({column}, ?) je WHERE CAST(je.value AS TEXT)=?)"
-                )
-                params.extend([json_path, str(s)])
-            where_parts.append('(' + ' OR '.join(clauses) + ')')
+            # A single json_each() scan matching any of the values
+            placeholders = ', '.join(['?'] * len(clean_values))
+            where_parts.append(
+                f"EXISTS (SELECT 1 FROM json_each({column}, ?) je WHERE CAST(je.value AS TEXT) IN ({placeholders}))"
+            )
+            params.extend([json_path, *map(str, clean_values)])
         
         if has_null_token:
             where_parts.append(
@@ -428,7 +449,14 @@ class TreeNodeMultipleChoiceFilter(django_filters.ModelMultipleChoiceFilter):
         return super().get_filter_predicate(v)
 
     def filter(self, qs, value):
-        value = [node.get_descendants(include_self=True) if not isinstance(node, str) else node for node in value]
+        nodes = [node for node in value if not isinstance(node, str)]
+        value = [node for node in value if isinstance(node, str)]
+        if nodes:
+            # A single subquery matching every selected node and its descendants, by tree bounds
+            value.append(type(nodes[0]).objects.filter(reduce(
+                operator.or_,
+                (Q(tree_id=node.tree_id, lft__gte=node.lft, lft__lte=node.rght) for node in nodes)
+            )))
         return super().filter(qs, value)
 
 
@@ -461,9 +489,6 @@ class JSONEmptyFilter(django_filters.BooleanFilter):
         self.json_key = json_key
 
     def filter(self, qs, value):
-        from django.db.models import F, Value, Func, IntegerField, BooleanField, Case, When, CharField
-        from django.db import models as _models
-        
         if value in EMPTY_VALUES:
             return qs
         
@@ -476,22 +501,8 @@ class JSONEmptyFilter(django_filters.BooleanFilter):
             else:
                 return qs.exclude(**{f'{field_name}__isnull': True})
         
-        json_path = f'$.{self.json_key}'
-        extracted = Func(F(field_name), Value(json_path), function='json_extract', output_field=_models.TextField())
-        qs = qs.annotate(_json_val=extracted)
-        jtype = Func(F(field_name), Value(json_path), function='json_type', output_field=CharField())
-        qs = qs.annotate(_json_type=jtype)
-        arr_len = Func(F(field_name), Value(json_path), function='json_array_length', output_field=IntegerField())
-        qs = qs.annotate(_json_array_len=arr_len)
-
-        is_empty = Case(
-            When(_json_val__isnull=True, then=Value(True)),
-            When(_json_type='array', _json_array_len=0, then=Value(True)),
-            default=Value(False),
-            output_field=BooleanField(),
-        )
-        qs = qs.annotate(_json_empty=is_empty)
-        return qs.filter(_json_empty=True) if is_true else qs.filter(_json_empty=False)
+        json_empty = JSONIsEmpty(F(field_name), f'$.{self.json_key}')
+        return qs.alias(_json_empty=json_empty).filter(_json_empty=is_true)
 
 
 class JSONBooleanFilter(django_filters.BooleanFilter):
@@ -513,12 +524,9 @@ class JSONBooleanFilter(django_filters.BooleanFilter):
         if not self.json_key:
             return qs.filter(**{f'{field_name}': is_true})
         
-        from django.db.models import F, IntegerField
-        from utilities.query_functions import JSONExtract
-        
         extracted = JSONExtract(F(field_name), f'$.{self.json_key}', output_field=IntegerField())
         target = 1 if is_true else 0
-        return qs.annotate(_json_bool=extracted).filter(_json_bool=target)
+        return qs.alias(_json_bool=extracted).filter(_json_bool=target)
 
 
 class NumericArrayFilter(django_filters.NumberFilter):
@@ -563,25 +571,19 @@ class JSONIntegerArrayContainsFilter(django_filters.MultipleChoiceFilter):
                 continue
         if not ints:
             return qs.none()
+        ints = list(dict.fromkeys(ints))
         
-        model = qs.model
-        field = model._meta.get_field(self.field_name)
-        table = model._meta.db_table
-        column = f'"{table}"."{field.column}"'
+        column = _column_sql(qs.model, self.field_name)
         json_path = f'$.{self.json_key}'
-        clauses = []
-        params = []
         guard = f"json_type({column}, ?) = 'array'"
-        params.append(json_path)
-        
-        for n in ints:
-            clauses.append(
-                f"EXISTS (SELECT 1 FROM json_each({column}, ?) je WHERE CAST(je.value AS INTEGER)=?)"
-            )
-            params.extend([json_path, n])
+        # A single json_each() scan matching any of the values
+        placeholders = ', '.join(['?'] * len(ints))
+        contains = (
+            f"EXISTS (SELECT 1 FROM json_each({column}, ?) je WHERE CAST(je.value AS INTEGER) IN ({placeholders}))"
+        )
         
-        where = f"({guard}) AND (" + " OR ".join(clauses) + ")"
-        return qs.extra(where=[where], params=params)
+        where = f"({guard}) AND {contains}"
+        return qs.extra(where=[where], params=[json_path, json_path, *ints])
 
 
 class ContentTypeFilter(django_filters.CharFilter):
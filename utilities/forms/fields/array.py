@@ -23,15 +23,17 @@ class SimpleArrayField(forms.Field):
         if isinstance(value, str):
             if value.strip() == '':
                 return []
-            return [v.strip() for v in value.split(',')]
+            return list(map(str.strip, value.split(',')))
         if isinstance(value, (list, tuple)):
             return list(value)
         return [value]
 
     def clean(self, value):
         # First convert to Python list
-        value = self.to_python(value)
-        # Then validate
+        return self._clean_list(self.to_python(value))
+
+    def _clean_list(self, value):
+        # Validate an already converted list
         self.validate(value)
         # Clean each item using base_field
         errors = []
@@ -55,11 +57,13 @@ __all__ = (
 class NumericArrayField(SimpleArrayField):
 
     def clean(self, value):
-        if value and not self.to_python(value):
+        # Parse the range string once, rather than again in SimpleArrayField.clean()
+        parsed = self.to_python(value)
+        if value and not parsed:
             raise forms.ValidationError(
                 _("Invalid list (%(value)s). Must be numeric and ranges must be in ascending order.") % {'value': value}
             )
-        return super().clean(value)
+        return self._clean_list(parsed)
 
     def to_python(self, value):
         if not value:
@@ -30,7 +30,7 @@ def parse_numeric_range(string, base=10):
       '0-3,5' => [0, 1, 2, 3, 5]
       '2,8-b,d,f' => [2, 8, 9, a, b, d, f]
     """
-    values = list()
+    values = set()
     for dash_range in string.split(','):
         try:
             begin, end = dash_range.split('-')
@@ -40,8 +40,8 @@ def parse_numeric_range(string, base=10):
             begin, end = int(begin.strip(), base=base), int(end.strip(), base=base) + 1
         except ValueError:
             raise forms.ValidationError(_('Range "{value}" is invalid.').format(value=dash_range))
-        values.extend(range(begin, end))
-    return sorted(set(values))
+        values.update(range(begin, end))
+    return sorted(values)
 
 
 def parse_alphanumeric_range(string):
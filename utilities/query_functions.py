@@ -1,5 +1,5 @@
 from django.db import models
-from django.db.models import Func, F
+from django.db.models import Func, F, Value
 
 from utilities.sqlite_collations import _collate_natural
 
@@ -8,36 +8,33 @@ __all__ = (
     'CollateNatural',
     'EmptyGroupByJSONBAgg',
     'JSONExtract',
+    'JSONIsEmpty',
 )
 
 
 class CollateAsChar(Func):
     """SQLite collation as plain character string using BINARY."""
+    template = '%(expressions)s COLLATE BINARY'
+
     def __init__(self, expression, **extra):
         # Allow passing a field name as a string
         if isinstance(expression, str):
             expression = F(expression)
         super().__init__(expression, **extra)
 
-    def as_sql(self, compiler, connection, **extra_context):
-        self.template = '%(expressions)s COLLATE BINARY'
-        return super().as_sql(compiler, connection, **extra_context)
-
 
 class CollateNatural(Func):
     """SQLite natural sort collation registered at runtime."""
+    template = '%(expressions)s COLLATE natural_sort'
+
     def __init__(self, expression, **extra):
         if isinstance(expression, str):
             expression = F(expression)
         super().__init__(expression, **extra)
 
-    def as_sql(self, compiler, connection, **extra_context):
-        self.template = '%(expressions)s COLLATE natural_sort'
-        return super().as_sql(compiler, connection, **extra_context)
-
 
 class JSONExtract(Func):
-    """SQLite json_extract helper with correctly quoted JSON path."""
+    """SQLite json_extract helper; the JSON path is passed as a bound query parameter."""
     function = 'json_extract'
     output_field = models.TextField()
 
@@ -47,12 +44,30 @@ class JSONExtract(Func):
         self.json_path = path
         if output_field is None:
             output_field = self.output_field
-        super().__init__(expression, output_field=output_field, **extra)
+        super().__init__(expression, Value(path), output_field=output_field, **extra)
+
+
+class JSONIsEmpty(Func):
+    """
+    SQLite test of whether the JSON value at a path is empty: a missing key, null, or an array of length 0.
+    """
+    # A simple CASE evaluates json_type() once per row; json_array_length() is only computed for arrays. A missing key
+    # or NULL column yields a NULL type, which is treated like an explicit JSON null.
+    template = (
+        "(CASE IFNULL(json_type(%(expressions)s), 'null') "
+        "WHEN 'null' THEN 1 WHEN 'array' THEN json_array_length(%(expressions)s) = 0 ELSE 0 END)"
+    )
+    output_field = models.BooleanField()
+
+    def __init__(self, expression, path, **extra):
+        if isinstance(expression, str):
+            expression = F(expression)
+        super().__init__(expression, Value(path), **extra)
 
     def as_sql(self, compiler, connection, **extra_context):
-        self.template = "json_extract(%(expressions)s, '%(json_path)s')"
-        extra_context.update({'json_path': self.json_path})
-        return super().as_sql(compiler, connection, **extra_context)
+        sql, params = super().as_sql(compiler, connection, **extra_context)
+        # The expressions appear twice in the template, and so must their parameters
+        return sql, (*params, *params)
 
 
 class EmptyGroupByJSONBAgg(Func):
@@ -65,6 +80,10 @@ class EmptyGroupByJSONBAgg(Func):
     contains_aggregate = True
     output_field = models.TextField()
 
+    def get_group_by_cols(self):
+        # Never group by the aggregated expressions (as with Aggregate)
+        return []
+
     def as_sql(self, compiler, connection, **extra_context):
         function = 'json_group_array'
         if len(self.source_expressions) == 3:
@@ -8,12 +8,14 @@ Provides:
 
 import json
 import re
+from functools import lru_cache
 
 from django.db.backends.signals import connection_created
 from netaddr import IPNetwork, IPAddress
 
-# Compile regex once at module level for performance
-_NATURAL_SORT_CHUNK_RE = re.compile(r'(\d+|\D+)')
+# Compile regex once at module level for performance. Digit and non-digit runs are captured by separate groups, so
+# each match already tells which kind of chunk it is.
+_NATURAL_SORT_CHUNK_RE = re.compile(r'(\d+)|(\D+)')
 
 
 def _collate_c(a, b):
@@ -21,10 +23,14 @@ def _collate_c(a, b):
     return (a > b) - (a < b)
 
 
+@lru_cache(maxsize=65536)
 def _natkey(s):
     """Generate natural sort key from string."""
-    parts = _NATURAL_SORT_CHUNK_RE.findall(s or '')
-    return [(0, int(p)) if p.isdigit() else (1, p.lower()) for p in parts]
+    # Cached because a sort passes each value to the collation many times
+    return tuple(
+        (0, int(digits)) if digits else (1, text.lower())
+        for digits, text in _NATURAL_SORT_CHUNK_RE.findall(s or '')
+    )
 
 
 def _collate_natural(a, b):
@@ -33,43 +39,58 @@ def _collate_natural(a, b):
     return (ka > kb) - (ka < kb)
 
 
+# A canonical IPv4 address (decimal octets 0-255 without leading zeros), optionally followed by a prefix length 0-32.
+# Matching values are handled without netaddr; anything else (IPv6, other notations, invalid input) falls back to it.
+_OCTET = r'(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])'
+_IPV4_RE = re.compile(rf'({_OCTET}(?:\.{_OCTET}){{3}})(?:/(3[0-2]|[12]?[0-9]))?')
+
+
+# Parsed values are cached, since the UDFs below are invoked with the same column values over and over
+@lru_cache(maxsize=65536)
+def _parse_net(value):
+    """Parse a network string into a (version, first, last, prefixlen) tuple, or None if it is invalid."""
+    try:
+        net = IPNetwork(value)
+    except Exception:
+        return None
+    return net.version, net.first, net.last, net.prefixlen
+
+
+@lru_cache(maxsize=65536)
+def _parse_addr(value):
+    """Parse the host portion of an address string (any mask is ignored) into an IPAddress, or None if invalid."""
+    try:
+        return IPAddress(str(value).split('/')[0])
+    except Exception:
+        return None
+
+
 # SQLite UDF implementations
 def _inet_contains(parent, child):
     """Check if parent network strictly contains child network."""
-    try:
-        p = IPNetwork(parent)
-        c = IPNetwork(child)
-        return int((c in p) and (c != p))
-    except Exception:
+    p, c = _parse_net(parent), _parse_net(child)
+    if p is None or c is None or p[0] != c[0]:
         return 0
+    return int(p[1] <= c[1] and c[2] <= p[2] and (c[1], c[2]) != (p[1], p[2]))
 
 
 def _inet_contains_or_equals(parent, child):
     """Check if parent network contains or equals child network."""
-    try:
-        p = IPNetwork(parent)
-        c = IPNetwork(child)
-        return int((c in p) or (c == p))
-    except Exception:
+    p, c = _parse_net(parent), _parse_net(child)
+    if p is None or c is None or p[0] != c[0]:
         return 0
+    return int(p[1] <= c[1] and c[2] <= p[2])
 
 
 def _inet_contained(child, parent):
     """Check if child network is strictly contained in parent network."""
-    try:
-        c = IPNetwork(child)
-        p = IPNetwork(parent)
-        return int((c in p) and (c != p))
-    except Exception:
-        return 0
+    return _inet_contains(parent, child)
 
 
 def _inet_host(address):
     """Extract host address from CIDR notation."""
-    try:
-        return str(IPAddress(str(address).split('/')[0]))
-    except Exception:
-        return None
+    ip = _parse_addr(address)
+    return str(ip) if ip is not None else None
 
 
 def _inet_cast(value):
@@ -79,10 +100,14 @@ def _inet_cast(value):
     For IPv6: '6:' + 32 hex digits (no colons), uppercase (e.g., full expanded form)
     Accepts inputs with or without mask; mask is ignored for comparison key.
     """
+    s = str(value) if value is not None else ''
+    # Fast path: canonical IPv4 needs no IPAddress
+    if match := _IPV4_RE.fullmatch(s):
+        a, b, c, d = map(int, match[1].split('.'))
+        return f'4:{a:03d}{b:03d}{c:03d}{d:03d}'
+
     try:
-        s = str(value) if value is not None else ''
-        host = s.split('/')[0]
-        ip = IPAddress(host)
+        ip = _parse_addr(s)
         if ip.version == 4:
             parts = [f"{int(o):03d}" for o in str(ip).split('.')]
             return '4:' + ''.join(parts)
@@ -95,23 +120,24 @@ def _inet_cast(value):
 
 def _family(address):
     """Return IP address family (4 or 6)."""
-    try:
-        ip = IPAddress(str(address).split('/')[0])
-        return int(ip.version)
-    except Exception:
-        return None
+    if _IPV4_RE.fullmatch(str(address)):
+        return 4
+    ip = _parse_addr(address)
+    return int(ip.version) if ip is not None else None
 
 
 def _masklen(address):
     """Return network mask length."""
-    try:
-        s = str(address)
-        if '/' in s:
-            return int(IPNetwork(s).prefixlen)
-        ip = IPAddress(s)
-        return 32 if ip.version == 4 else 128
-    except Exception:
+    s = str(address)
+    if match := _IPV4_RE.fullmatch(s):
+        return int(match[2]) if match[2] is not None else 32
+    if '/' in s:
+        net = _parse_net(s)
+        return net[3] if net is not None else None
+    ip = _parse_addr(s)
+    if ip is None:
         return None
+    return 32 if ip.version == 4 else 128
 
 
 def _regexp(pattern, value):
@@ -122,41 +148,56 @@ def _regexp(pattern, value):
         return 0
 
 
-def _range_array_contains(json_array, scalar):
-    """Check if scalar is contained in any range from JSON array."""
+@lru_cache(maxsize=1024)
+def _parse_range_array(json_array):
+    """Parse a JSON array of ranges into a tuple of inclusive (lower, upper) integer bounds."""
     try:
-        ranges = json.loads(json_array) if isinstance(json_array, str) else json_array
-    except Exception:
-        return 0
-    
-    try:
-        v = int(scalar)
+        ranges = json.loads(json_array)
     except Exception:
-        return 0
-    
+        return ()
     if not ranges:
-        return 0
-    
+        return ()
+
+    bounds_list = []
     for r in ranges:
         try:
             lower = int(r.get('lower'))
             upper = int(r.get('upper'))
             bounds = str(r.get('bounds', '[)'))
-            lower_inc = bounds.startswith('[')
-            upper_inc = bounds.endswith(']')
-            lower_ok = (v >= lower) if lower_inc else (v > lower)
-            upper_ok = (v <= upper) if upper_inc else (v < upper)
-            if lower_ok and upper_ok:
-                return 1
+            bounds_list.append((
+                lower if bounds.startswith('[') else lower + 1,
+                upper if bounds.endswith(']') else upper - 1,
+            ))
         except Exception:
             continue
+    return tuple(bounds_list)
+
+
+def _range_array_contains(json_array, scalar):
+    """Check if scalar is contained in any range from JSON array."""
+    # Many rows share the same ranges (e.g. the default VLAN group range), so parsed arrays are cached by their text
+    if not isinstance(json_array, str):
+        return 0
+
+    try:
+        v = int(scalar)
+    except Exception:
+        return 0
+
+    for lower, upper in _parse_range_array(json_array):
+        if lower <= v <= upper:
+            return 1
     return 0
 
 
+# Parsed JSON arrays, keyed by their text. Values are shared between calls and must not be modified.
+_load_json = lru_cache(maxsize=4096)(json.loads)
+
+
 def _array_contains(json_array, scalar):
     """Check if JSON array contains scalar value."""
     try:
-        arr = json.loads(json_array) if isinstance(json_array, str) else json_array
+        arr = _load_json(json_array) if isinstance(json_array, str) else json_array
     except Exception:
         return 0
     
@@ -174,7 +215,7 @@ def _array_contains(json_array, scalar):
 def _choices_contains_value(json_array, scalar):
     """Check if JSON choice array contains value."""
     try:
-        arr = json.loads(json_array) if isinstance(json_array, str) else json_array
+        arr = _load_json(json_array) if isinstance(json_array, str) else json_array
     except Exception:
         return 0
     
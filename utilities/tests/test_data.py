@@ -92,6 +92,14 @@ class RangeFunctionsTestCase(TestCase):
             ]
         )
 
+        self.assertEqual(
+            string_to_ranges('1 - 2, 5'),
+            [
+                NumericRange(1, 3, bounds='[)'),  # 1-3
+                NumericRange(5, 6, bounds='[)'),  # 5-6
+            ]
+        )
+
         self.assertEqual(
             string_to_ranges('2-10, a-b'),
             None  # Fails to convert